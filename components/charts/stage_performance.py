@@ -206,6 +206,15 @@ def _create_fantasy_performance_insights(completed_stages: list, df: pd.DataFram
     """Analyze fantasy performance based on stage results"""
     st.markdown("#### 💰 Fantasy Performance Insights")
 
+    # Lowercase each fantasy name once and read the needed columns as tuples, rather than
+    # rebuilding every fantasy row with iterrows for each stage result
+    fantasy_riders_by_name = [
+        (full_name.lower(), stars, position, team)
+        for full_name, stars, position, team in zip(
+            df["full_name"], df["stars"], df["position"], df["team"], strict=True
+        )
+    ]
+
     # Extract all riders from completed stage results
     all_stage_riders = []
     for i, stage in enumerate(completed_stages, 1):
@@ -214,16 +223,18 @@ def _create_fantasy_performance_insights(completed_stages: list, df: pd.DataFram
 
         for result in results:
             rider_name = result.get("rider_name", "")
+            rider_name_lower = rider_name.lower()
             # Try to match with fantasy riders
             fantasy_match = None
-            for _, fantasy_rider in df.iterrows():
-                if (
-                    rider_name.lower() in fantasy_rider["full_name"].lower()
-                    or fantasy_rider["full_name"].lower() in rider_name.lower()
-                ):
+            for fantasy_rider in fantasy_riders_by_name:
+                full_name_lower = fantasy_rider[0]
+                if rider_name_lower in full_name_lower or full_name_lower in rider_name_lower:
                     fantasy_match = fantasy_rider
                     break
 
+            fantasy_stars, fantasy_position, fantasy_team = (
+                fantasy_match[1:] if fantasy_match is not None else (None, None, None)
+            )
             all_stage_riders.append(
                 {
                     "stage": f"Stage {i}",
@@ -231,11 +242,9 @@ def _create_fantasy_performance_insights(completed_stages: list, df: pd.DataFram
                     "rank": result.get("rank", 999),
                     "pcs_points": result.get("pcs_points", 0),
                     "profile": profile,
-                    "fantasy_stars": fantasy_match["stars"] if fantasy_match is not None else None,
-                    "fantasy_position": fantasy_match["position"]
-                    if fantasy_match is not None
-                    else None,
-                    "fantasy_team": fantasy_match["team"] if fantasy_match is not None else None,
+                    "fantasy_stars": fantasy_stars,
+                    "fantasy_position": fantasy_position,
+                    "fantasy_team": fantasy_team,
                 }
             )
 
@@ -9,8 +9,11 @@ from typing import Any
 FANTASY_DATA_FILE = "fantasy-data.json"
 
 # Cache file settings
-PCS_CACHE_FILE = "pcs_data_cache.json"
-RACE_CACHE_FILE = "race_data_cache.json"
+PCS_CACHE_FILE = "pcs_data_cache.db"
+RACE_CACHE_FILE = "race_data_cache.db"
+# Single-blob JSON caches used before the SQLite caches; imported once if still present
+LEGACY_PCS_CACHE_FILE = "pcs_data_cache.json"
+LEGACY_RACE_CACHE_FILE = "race_data_cache.json"
 CACHE_EXPIRY_DAYS = 7  # Cache expires after 7 days
 CACHE_EXPIRY_DELTA = timedelta(days=CACHE_EXPIRY_DAYS)
 
@@ -12,8 +12,9 @@ Key principles:
 - Modular design for different types of analysis
 """
 
+import re
 import statistics
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 import numpy as np
@@ -27,6 +28,9 @@ from data.models.combined_analytics import (
 from data.models.race import ComputedRaceInfo, RaceData, StageData
 from data.models.unified import RiderMatchInfo
 
+# Leading number of a stage distance, whether stored as "150.5 km" or as a bare number
+_DISTANCE_RE = re.compile(r"\s*(\d+(?:\.\d+)?)")
+
 # =============================================================================
 # Basic Rider Analytics
 # =============================================================================
@@ -163,17 +167,26 @@ def calculate_enhanced_rider_analytics(
         "data_completeness_score": 0.0,
     }
 
-    for col, default_val in enhanced_columns.items():
-        riders_df[col] = default_val
+    if riders_df.empty:
+        for col, default_val in enhanced_columns.items():
+            riders_df[col] = default_val
+        return riders_df
 
-    # Calculate enhanced analytics for each rider
-    for idx, row in riders_df.iterrows():
-        fantasy_name = row["fantasy_name"]
+    # Collect each column as a list and assign it once, instead of writing cells with .at
+    column_values = {
+        col: [default_val] * len(riders_df) for col, default_val in enhanced_columns.items()
+    }
+    for col in ("total_pcs_points", "total_uci_points", "pcs_per_star", "uci_per_star"):
+        column_values[col] = riders_df[col].tolist()
 
-        if fantasy_name not in matched_riders:
+    # Calculate enhanced analytics for each rider
+    for position, (fantasy_name, stars) in enumerate(
+        zip(riders_df["fantasy_name"], riders_df["stars"], strict=True)
+    ):
+        match_info = matched_riders.get(fantasy_name)
+        if match_info is None:
             continue
 
-        match_info = matched_riders[fantasy_name]
         race_match = match_info.get("race_match")
 
         if not race_match or race_match.match_confidence < 0.8:
@@ -185,69 +198,56 @@ def calculate_enhanced_rider_analytics(
                 match_info["fantasy_rider"], race_data, race_key
             )
 
-            # Update DataFrame with enhanced metrics
-            riders_df.at[idx, "stage_analytics_available"] = race_analytics.get(
-                "has_stage_data", False
-            )
-            riders_df.at[idx, "data_completeness_score"] = race_analytics.get(
-                "data_completeness_score", 0.0
-            )
-
-            # Stage performance
-            riders_df.at[idx, "avg_stage_position"] = race_analytics.get("avg_stage_position")
-            riders_df.at[idx, "median_stage_position"] = race_analytics.get(
-                "median_stage_position"
-            )
-            riders_df.at[idx, "best_stage_position"] = race_analytics.get("best_stage_position")
-            riders_df.at[idx, "worst_stage_position"] = race_analytics.get("worst_stage_position")
-            riders_df.at[idx, "stage_wins"] = race_analytics.get("stage_wins", 0)
-            riders_df.at[idx, "top_5_finishes"] = race_analytics.get("top_5_stage_finishes", 0)
-            riders_df.at[idx, "top_10_finishes"] = race_analytics.get("top_10_stage_finishes", 0)
-
-            # GC analytics
-            gc_analytics = race_analytics.get("gc_analytics")
-            if gc_analytics:
-                riders_df.at[idx, "gc_current_rank"] = gc_analytics.get("current_rank")
-                riders_df.at[idx, "gc_best_rank"] = gc_analytics.get("best_rank")
-
-            # Points analytics
-            points_analytics = race_analytics.get("points_analytics")
-            if points_analytics:
-                riders_df.at[idx, "points_current_rank"] = points_analytics.get("current_rank")
-                riders_df.at[idx, "points_best_rank"] = points_analytics.get("best_rank")
-
-            # KOM analytics
-            kom_analytics = race_analytics.get("kom_analytics")
-            if kom_analytics:
-                riders_df.at[idx, "kom_current_rank"] = kom_analytics.get("current_rank")
-                riders_df.at[idx, "kom_best_rank"] = kom_analytics.get("best_rank")
-
-            # Youth analytics
-            youth_analytics = race_analytics.get("youth_analytics")
-
-            if youth_analytics:
-                riders_df.at[idx, "youth_current_rank"] = youth_analytics.get("current_rank")
-                riders_df.at[idx, "youth_best_rank"] = youth_analytics.get("best_rank")
-
-            # Rider classification
-            riders_df.at[idx, "rider_type"] = race_analytics.get("rider_type_classification")
-
             # Override basic points with more accurate stage-based totals
             stage_pcs_points = race_analytics.get("total_stage_pcs_points", 0)
             stage_uci_points = race_analytics.get("total_stage_uci_points", 0)
 
-            riders_df.at[idx, "total_pcs_points"] = stage_pcs_points
-            riders_df.at[idx, "total_uci_points"] = stage_uci_points
+            updates = {
+                "stage_analytics_available": race_analytics.get("has_stage_data", False),
+                "data_completeness_score": race_analytics.get("data_completeness_score", 0.0),
+                # Stage performance
+                "avg_stage_position": race_analytics.get("avg_stage_position"),
+                "median_stage_position": race_analytics.get("median_stage_position"),
+                "best_stage_position": race_analytics.get("best_stage_position"),
+                "worst_stage_position": race_analytics.get("worst_stage_position"),
+                "stage_wins": race_analytics.get("stage_wins", 0),
+                "top_5_finishes": race_analytics.get("top_5_stage_finishes", 0),
+                "top_10_finishes": race_analytics.get("top_10_stage_finishes", 0),
+                # Rider classification
+                "rider_type": race_analytics.get("rider_type_classification"),
+                "total_pcs_points": stage_pcs_points,
+                "total_uci_points": stage_uci_points,
+            }
+
+            # Classification analytics (GC, points, KOM, youth)
+            for prefix in ("gc", "points", "kom", "youth"):
+                classification_analytics = race_analytics.get(f"{prefix}_analytics")
+                if classification_analytics:
+                    updates[f"{prefix}_current_rank"] = classification_analytics.get(
+                        "current_rank"
+                    )
+                    updates[f"{prefix}_best_rank"] = classification_analytics.get("best_rank")
 
             # Recalculate per-star ratios
-            stars = row["stars"]
             if stars > 0:
-                riders_df.at[idx, "pcs_per_star"] = stage_pcs_points / stars
-                riders_df.at[idx, "uci_per_star"] = stage_uci_points / stars
+                updates["pcs_per_star"] = stage_pcs_points / stars
+                updates["uci_per_star"] = stage_uci_points / stars
+
+            for col, value in updates.items():
+                column_values[col][position] = value
 
         except Exception as e:
             print(f"Warning: Enhanced analytics failed for {fantasy_name}: {e}")
 
+    for col, values in column_values.items():
+        if col in enhanced_columns:
+            # Columns defaulting to None stay object dtype so missing values remain None
+            dtype = object if enhanced_columns[col] is None else None
+        else:
+            # Overridden basic columns keep at least their original precision
+            dtype = np.result_type(riders_df[col].dtype, pd.Series(values).dtype)
+        riders_df[col] = pd.Series(values, index=riders_df.index, dtype=dtype)
+
     return riders_df
 
 
@@ -260,6 +260,9 @@ def calculate_race_computed_properties(race_data: RaceData) -> ComputedRaceInfo:
     """
     Calculate computed properties for race data.
 
+    Not memoized on purpose: stage completion depends on today's date, and the
+    computation is far cheaper than hashing the race data for a cache key.
+
     Args:
         race_data: Raw race data
 
@@ -268,11 +271,15 @@ def calculate_race_computed_properties(race_data: RaceData) -> ComputedRaceInfo:
     """
     stages = race_data.get("stages", [])
 
+    # Decide each stage's completion once; both stat helpers split on it
+    today = datetime.now().date()
+    completion = [_is_stage_completed(stage, today) for stage in stages]
+
     # Calculate stage statistics
-    stage_stats = _calculate_stage_stats(stages)
+    stage_stats = _calculate_stage_stats(stages, completion)
 
     # Calculate climb statistics
-    climb_stats = _calculate_climb_stats(stages)
+    climb_stats = _calculate_climb_stats(stages, completion)
 
     # Build computed info
     computed_info: ComputedRaceInfo = {}
@@ -334,20 +341,12 @@ def calculate_race_analytics_summary(race_data: RaceData, race_key: str) -> Race
 
         # Collect all riders
         results = stage.get("results", [])
-        for result in results:
-            rider_name = result.get("rider_name")
-            if rider_name:
-                total_riders.add(rider_name)
+        total_riders.update(filter(None, (result.get("rider_name") for result in results)))
 
         # Sum distance (if available and numeric)
-        distance_str = stage.get("distance", "")
-        if distance_str:
-            try:
-                # Extract numeric part (e.g., "150.5 km" -> 150.5)
-                distance_num = float(distance_str.split()[0])
-                total_distance += distance_num
-            except (ValueError, IndexError):
-                pass
+        distance_num = parse_distance_km(stage.get("distance"))
+        if distance_num is not None:
+            total_distance += distance_num
 
     # Get current leaders
     current_leaders = {}
@@ -410,9 +409,12 @@ def calculate_race_specific_analytics(
     stages = race_data.get("stages", [])
     completed_stages = [stage for stage in stages if stage.get("results")]
 
-    # Extract stage performances (simplified)
+    # Extract stage performances (simplified), accumulating counts and point totals as we go
     stage_results = []
     stage_ranks = []
+    top_10_finishes = top_5_finishes = stage_wins = 0
+    total_stage_pcs = total_stage_uci = 0
+    normalized_name = normalize_rider_name(canonical_name)
 
     for i, stage in enumerate(completed_stages, 1):
         stage_results_data = stage.get("results", [])
@@ -420,9 +422,7 @@ def calculate_race_specific_analytics(
         # Find rider in stage results
         rider_result = None
         for result in stage_results_data:
-            if normalize_rider_name(result.get("rider_name", "")) == normalize_rider_name(
-                canonical_name
-            ):
+            if normalize_rider_name(result.get("rider_name", "")) == normalized_name:
                 rider_result = result
                 break
 
@@ -430,29 +430,32 @@ def calculate_race_specific_analytics(
             rank = rider_result.get("rank")
             if rank:
                 stage_ranks.append(rank)
+                if rank <= 10:
+                    top_10_finishes += 1
+                    if rank <= 5:
+                        top_5_finishes += 1
+                        if rank == 1:
+                            stage_wins += 1
+
+                pcs_points = rider_result.get("pcs_points", 0)
+                uci_points = rider_result.get("uci_points", 0)
+                total_stage_pcs += pcs_points
+                total_stage_uci += uci_points
 
                 stage_perf = StagePerformance(
                     stage_number=i,
                     stage_rank=rank,
-                    stage_pcs_points=rider_result.get("pcs_points", 0),
-                    stage_uci_points=rider_result.get("uci_points", 0),
+                    stage_pcs_points=pcs_points,
+                    stage_uci_points=uci_points,
                 )
                 stage_results.append(stage_perf)
 
     # Calculate basic statistics
-    avg_stage_position = statistics.mean(stage_ranks) if stage_ranks else None
+    avg_stage_position = sum(stage_ranks) / len(stage_ranks) if stage_ranks else None
     median_stage_position = statistics.median(stage_ranks) if stage_ranks else None
     best_stage_position = min(stage_ranks) if stage_ranks else None
     worst_stage_position = max(stage_ranks) if stage_ranks else None
 
-    top_10_finishes = sum(1 for rank in stage_ranks if rank <= 10)
-    top_5_finishes = sum(1 for rank in stage_ranks if rank <= 5)
-    stage_wins = sum(1 for rank in stage_ranks if rank == 1)
-
-    # Calculate point totals
-    total_stage_pcs = sum(p.get("stage_pcs_points", 0) for p in stage_results)
-    total_stage_uci = sum(p.get("stage_uci_points", 0) for p in stage_results)
-
     # Data completeness
     has_pcs_data = bool(rider.get("pcs_data"))
     has_stage_data = bool(stage_results)
@@ -465,7 +468,7 @@ def calculate_race_specific_analytics(
     return RiderRaceAnalytics(
         # Identification
         rider_name=canonical_name,
-        normalized_rider_name=normalize_rider_name(canonical_name),
+        normalized_rider_name=normalized_name,
         fantasy_name=rider.get("fantasy_name"),
         team_name=rider.get("team"),
         # Data tracking
@@ -554,14 +557,21 @@ def _extract_demographics(pcs_data: dict[str, Any]) -> dict[str, Any]:
     return demographics
 
 
-def _is_stage_completed(stage: StageData) -> bool:
+def parse_distance_km(distance: Any) -> float | None:
+    """Numeric part of a stage distance (e.g., "150.5 km" -> 150.5, 78.8 -> 78.8)."""
+    if distance is None:
+        return None
+    match = _DISTANCE_RE.match(str(distance))
+    return float(match.group(1)) if match else None
+
+
+def _is_stage_completed(stage: StageData, today: date) -> bool:
     """Check if a stage has been completed based on available data."""
-    today = datetime.now().date()
     stage_date = stage.get("date")
 
     try:
         # Assuming date format is "MM-DD" for 2025
-        stage_date_obj = datetime.strptime(f"2025-{stage_date}", "%Y-%m-%d").date()
+        stage_date_obj = date.fromisoformat(f"2025-{stage_date}")
         is_completed = stage_date_obj <= today
     except ValueError:
         # Check for alternative completion indicators
@@ -574,86 +584,73 @@ def _is_stage_completed(stage: StageData) -> bool:
     return is_completed
 
 
-def _calculate_stage_stats(stages: list[StageData]) -> dict[str, Any]:
-    """Calculate statistics about stages."""
+def _calculate_stage_stats(stages: list[StageData], completion: list[bool]) -> dict[str, Any]:
+    """Calculate statistics about stages, given each stage's completion flag."""
     if not stages:
         return {}
 
     distances = []
     vertical_meters = []
-    completed_stages = []
-    incomplete_stages = []
-
-    for stage in stages:
-        # Parse distance
-        if stage.get("distance") is not None:
-            try:
-                # Extract numeric part (e.g., "150.5 km" -> 150.5)
-                distance_str = str(stage.get("distance", ""))
-                distance_num = float(distance_str.split()[0])
-                distances.append(distance_num)
-            except (ValueError, IndexError):
-                pass
+    completed_count = 0
+    incomplete_count = 0
+    completed_distance = 0.0
+    incomplete_distance = 0.0
+    shortest_stage = None
+    longest_stage = None
+    shortest_distance = float("inf")
+    longest_distance = float("-inf")
+
+    # Parse each stage's distance once and fold it into every statistic in the same pass
+    for stage, is_completed in zip(stages, completion, strict=True):
+        distance_num = parse_distance_km(stage.get("distance"))
+        if distance_num is not None:
+            if distance_num < shortest_distance:
+                shortest_stage, shortest_distance = stage, distance_num
+            if distance_num > longest_distance:
+                longest_stage, longest_distance = stage, distance_num
+            distances.append(distance_num)
 
         # Parse vertical meters
         if stage.get("vertical_meters") is not None:
             vertical_meters.append(stage.get("vertical_meters"))
 
         # Check completion status
-        if _is_stage_completed(stage):
-            completed_stages.append(stage)
+        if is_completed:
+            completed_count += 1
+            completed_distance += distance_num or 0.0
         else:
-            incomplete_stages.append(stage)
+            incomplete_count += 1
+            incomplete_distance += distance_num or 0.0
 
-    # Find shortest and longest stages
-    shortest_stage = None
-    longest_stage = None
-    if distances and stages:
-        stages_with_distances = [
-            (stage, float(str(stage.get("distance", "0")).split()[0]))
-            for stage in stages
-            if stage.get("distance") is not None
-        ]
-
-        if stages_with_distances:
-            shortest_stage = min(stages_with_distances, key=lambda x: x[1])[0]
-            longest_stage = max(stages_with_distances, key=lambda x: x[1])[0]
+    total_distance = sum(distances)
 
     return {
-        "total_distance": sum(distances) if distances else None,
-        "avg_distance": sum(distances) / len(distances) if distances else None,
+        "total_distance": total_distance if distances else None,
+        "avg_distance": total_distance / len(distances) if distances else None,
         "avg_vertical_meters": (
             sum(vertical_meters) / len(vertical_meters) if vertical_meters else None
         ),
         "shortest_stage": shortest_stage,
         "longest_stage": longest_stage,
-        "completed_count": len(completed_stages),
-        "incomplete_count": len(incomplete_stages),
-        "completed_distance": (
-            sum(float(str(stage.get("distance", "0")).split()[0]) for stage in completed_stages)
-            if completed_stages
-            else None
-        ),
-        "incomplete_distance": (
-            sum(float(str(stage.get("distance", "0")).split()[0]) for stage in incomplete_stages)
-            if incomplete_stages
-            else None
-        ),
+        "completed_count": completed_count,
+        "incomplete_count": incomplete_count,
+        "completed_distance": completed_distance if completed_count else None,
+        "incomplete_distance": incomplete_distance if incomplete_count else None,
     }
 
 
-def _calculate_climb_stats(stages: list[StageData]) -> dict[str, Any]:
-    """Calculate statistics about climbs across all stages."""
+def _calculate_climb_stats(stages: list[StageData], completion: list[bool]) -> dict[str, Any]:
+    """Calculate statistics about climbs across all stages, given each stage's completion flag."""
     total_climbs = 0
     completed_climbs = 0
     incomplete_climbs = 0
 
-    for stage in stages:
+    for stage, is_completed in zip(stages, completion, strict=True):
         stage_climbs = stage.get("climbs", [])
         stage_climb_count = len(stage_climbs)
         total_climbs += stage_climb_count
 
-        if _is_stage_completed(stage):
+        if is_completed:
             completed_climbs += stage_climb_count
         else:
             incomplete_climbs += stage_climb_count
@@ -9,7 +9,7 @@ from typing import Any, Literal
 
 import pandas as pd
 
-from .loaders import load_race_data
+from .loaders import load_raw_race_data
 from .models.combined_analytics import RaceAnalyticsSummary, RiderRaceAnalytics
 from .models.race import RaceData
 from .models.rider import RiderData
@@ -17,7 +17,6 @@ from .processors.combined_rider_analytics import (
     calculate_race_analytics_summary,
     calculate_race_specific_analytics,
 )
-from .processors.rider_matching import match_riders_across_sources
 
 
 class RaceAnalyticsAPI:
@@ -39,7 +38,7 @@ class RaceAnalyticsAPI:
     def race_data(self) -> RaceData:
         """Lazy load race data."""
         if self._race_data is None:
-            self._race_data = load_race_data(self.race_key)
+            self._race_data = load_raw_race_data(self.race_key)
         return self._race_data
 
     def get_rider_race_analytics(
@@ -82,8 +81,8 @@ class RaceAnalyticsAPI:
         """
         results = {}
 
-        for _, rider in riders.iterrows():
-            rider_dict = rider.to_dict()
+        # One bulk conversion instead of building a Series and a dict per row
+        for rider_dict in riders.to_dict("records"):
             fantasy_name = rider_dict.get("fantasy_name", "")
 
             if fantasy_name:
@@ -160,13 +159,18 @@ class RaceAnalyticsAPI:
 
         analytics_list = []
 
+        # Select every requested rider in one pass, keeping the first row per name
+        selected = riders_df[riders_df["fantasy_name"].isin(rider_names)].drop_duplicates(
+            "fantasy_name"
+        )
+        rows_by_name = {row["fantasy_name"]: row for row in selected.to_dict("records")}
+
         # Get analytics for each rider
         for rider_name in rider_names:
-            rider_row = riders_df[riders_df["fantasy_name"] == rider_name]
-            if rider_row.empty:
+            rider_dict = rows_by_name.get(rider_name)
+            if rider_dict is None:
                 continue
 
-            rider_dict = rider_row.iloc[0].to_dict()
             analytics = self.get_rider_race_analytics(rider_dict)
             analytics_list.append(analytics)
             comparison_data["riders"][rider_name] = analytics
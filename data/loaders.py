@@ -6,6 +6,9 @@ No analytics or matching logic is performed here - only raw data retrieval.
 """
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Any
 
 from config.settings import SUPPORTED_RACES
@@ -16,10 +19,21 @@ from data.sources.pcs_api import (
     fetch_rider_pcs_data,
     fetch_startlist_data,
     load_pcs_cache,
+    load_pcs_cache_keys,
     load_startlist_cache,
-    save_pcs_cache,
+    save_pcs_cache_entry,
 )
-from data.sources.race_api import fetch_race_data, load_race_cache, save_race_cache
+from data.sources.race_api import (
+    fetch_race_data,
+    load_race_cache_entry,
+    save_race_cache_entry,
+)
+from utils.cache_manager import is_error_payload
+from utils.rate_limiter import RateLimiter
+
+# Progress is reported at most this many times per fetch run, since each update
+# is a Streamlit widget round trip
+_PROGRESS_UPDATES = 50
 
 
 def load_raw_fantasy_data() -> list[dict[str, Any]]:
@@ -93,79 +107,129 @@ def load_raw_race_data(race_key: str) -> RaceData:
             "climbs": [],
         }
 
-    # Load cached race data
-    cached_data = load_race_cache()
     race_info = SUPPORTED_RACES[race_key]
     race_info_key = race_info["url_path"]
 
     # Return cached data if available
-    if race_info_key in cached_data:
+    cached_race = load_race_cache_entry(race_info_key)
+    if cached_race is not None:
         logging.info(f"📋 Using cached race data for {race_key}")
-        return cached_data[race_info_key]
+        return cached_race
 
     # Fetch fresh data if not in cache
     race_result = fetch_race_data(race_key)
 
-    # Update cache with fetched data (no processing here)
-    new_cache_data = cached_data.copy()
-    new_cache_data[race_info_key] = race_result
-    save_race_cache(new_cache_data)
+    # Update cache with fetched data (no processing here); failed fetches are not cached
+    save_race_cache_entry(race_info_key, race_result)
 
     return race_result
 
 
 def fetch_missing_pcs_data(
-    rider_urls: list[str], existing_cache: dict[str, Any] | None = None
+    rider_urls: list[str],
+    existing_cache: dict[str, Any] | None = None,
+    max_workers: int = 4,
+    request_delay: float = 0.5,
+    progress_callback: Callable[[float, str], None] | None = None,
 ) -> dict[str, Any]:
     """
     Fetch PCS data for riders not in cache.
 
+    Fetches run concurrently on a bounded thread pool, since each request is
+    a blocking network call made by the procyclingstats scraper. All workers
+    share one rate limiter, so request starts average at most one per
+    request_delay seconds while allowing a burst of up to max_workers.
+
     Args:
         rider_urls: List of PCS rider URLs to fetch
-        existing_cache: Existing cache to check against
+        existing_cache: Existing cache to check against (defaults to the cached rider URLs)
+        max_workers: Maximum number of concurrent requests
+        request_delay: Average spacing in seconds between requests (0 disables limiting)
+        progress_callback: Called with (fraction_done, status) as each fetch completes
 
     Returns:
         Dict mapping rider URLs to PCS data (new fetches only)
     """
-    if existing_cache is None:
-        existing_cache = load_pcs_cache()
+    # Only membership is needed, so avoid decoding every cached rider
+    cached_urls = load_pcs_cache_keys() if existing_cache is None else existing_cache.keys()
+
+    # Deduplicate while preserving order so each rider is fetched once
+    missing_urls = [url for url in dict.fromkeys(rider_urls) if url not in cached_urls]
 
     new_data = {}
 
-    for rider_url in rider_urls:
-        if rider_url not in existing_cache:
-            # Extract rider name from URL for logging
-            rider_name = rider_url.split("/")[-1].replace("-", " ").title()
-            pcs_data = fetch_rider_pcs_data(rider_url, rider_name)
-            new_data[rider_url] = pcs_data
+    if missing_urls:
+        max_workers = max(1, max_workers)
+        limiter = RateLimiter(1 / request_delay, burst=max_workers) if request_delay > 0 else None
+        total = len(missing_urls)
+        progress_step = -(-total // _PROGRESS_UPDATES)
+        fetched = 0
+        # One timestamp per run for any failed fetches
+        fetched_at = datetime.now().isoformat()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_rider_rate_limited, rider_url, limiter, fetched_at
+                ): rider_url
+                for rider_url in missing_urls
+            }
+            # Results are handled on the calling thread, so callbacks may touch the UI
+            for completed, future in enumerate(as_completed(futures), 1):
+                rider_url = futures[future]
+                pcs_data = future.result()
+                new_data[rider_url] = pcs_data
+
+                # Persist each successful fetch as it completes
+                if not is_error_payload(pcs_data):
+                    save_pcs_cache_entry(rider_url, pcs_data)
+                    fetched += 1
+
+                if progress_callback and (completed % progress_step == 0 or completed == total):
+                    progress_callback(
+                        completed / total,
+                        f"Fetched PCS data for {completed}/{total} riders",
+                    )
+
+        logging.info(f"✅ Fetched PCS data for {fetched}/{total} riders")
 
-            # Small delay to avoid overwhelming the API
-            import time
+    return new_data
 
-            time.sleep(0.5)
 
-    # Update cache if we fetched new data
-    if new_data:
-        updated_cache = existing_cache.copy()
-        updated_cache.update(new_data)
-        save_pcs_cache(updated_cache)
+def _fetch_rider_rate_limited(
+    rider_url: str, limiter: RateLimiter | None, fetched_at: str
+) -> dict[str, Any]:
+    """Fetch a single rider once the shared rate limiter allows it."""
+    if limiter is not None:
+        limiter.acquire()
 
-    return new_data
+    # Extract rider name from URL for logging
+    rider_name = rider_url.split("/")[-1].replace("-", " ").title()
+    return fetch_rider_pcs_data(rider_url, rider_name, fetched_at)
 
 
 def get_all_raw_data(race_key: str) -> RawDataSources:
     """
     Load all raw data sources for a race.
 
+    The sources are independent, so they load concurrently; on a cold cache the
+    startlist and race fetches overlap instead of running back to back.
+
     Args:
         race_key: Race identifier from SUPPORTED_RACES
 
     Returns:
         Dict containing all raw data sources
     """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        fantasy_riders = executor.submit(load_raw_fantasy_data)
+        startlist_riders = executor.submit(load_raw_startlist_data, race_key)
+        pcs_cache = executor.submit(load_raw_pcs_cache)
+        race_data = executor.submit(load_raw_race_data, race_key)
+
     return {
-        "fantasy_riders": load_raw_fantasy_data(),
-        "startlist_riders": load_raw_startlist_data(race_key),
-        "pcs_cache": load_raw_pcs_cache(),
-        "race_data": load_raw_race_data(race_key),
+        "fantasy_riders": fantasy_riders.result(),
+        "startlist_riders": startlist_riders.result(),
+        "pcs_cache": pcs_cache.result(),
+        "race_data": race_data.result(),
     }
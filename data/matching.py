@@ -13,20 +13,48 @@ Key principles:
 - Fallback strategies for partial matches
 """
 
-import logging
 import re
-from difflib import SequenceMatcher
+import unicodedata
+from collections import defaultdict
+from dataclasses import asdict
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+from rapidfuzz import fuzz, process
+
 from data.models.combined_analytics import RiderMatchingResult
-from data.models.race import RaceData
+from data.models.race import RaceData, StageData
 from data.models.unified import RawDataSources, RiderMatchInfo
 
 # =============================================================================
 # Core Name Processing
 # =============================================================================
 
+_PARENTHESES_RE = re.compile(r"\([^)]*\)\s*")
+_NAME_SUFFIXES = frozenset(("jr", "sr", "ii", "iii"))
+
+# Names are blocked on the first letters of each token; a surname's first three letters
+# almost never differ between spellings of the same rider, yet split the field finely
+_BLOCK_PREFIX_LENGTH = 3
+
+# Below this many search x candidate cells, cdist thread start-up outweighs the scoring
+_PARALLEL_CDIST_MIN_CELLS = 20_000
+
+# Upper bound on cells scored per cdist call (about 32 MB of float64 scores)
+_MAX_CDIST_CELLS = 4_000_000
+
+# Classification name -> stage data key, for extract_rider_from_classifications
+_STAGE_CLASSIFICATION_KEYS = {
+    "results": "results",
+    "gc": "general_classification",
+    "points": "points_classification",
+    "kom": "kom_classification",
+    "youth": "youth_classification",
+}
 
+
+@lru_cache(maxsize=8192)
 def normalize_rider_name(name: str) -> str:
     """
     Normalize rider name for consistent matching.
@@ -40,11 +68,20 @@ def normalize_rider_name(name: str) -> str:
     if not name:
         return ""
 
-    # Convert to lowercase and clean whitespace
-    normalized = re.sub(r"\s+", " ", name.lower().strip())
+    # Convert to lowercase; the final split/join trims and collapses whitespace
+    normalized = name.lower()
+
+    # Fold accents so "Chloé" and "Chloe" compare equal (letters like "ø" or "ß" are kept)
+    if not normalized.isascii():
+        normalized = "".join(
+            char
+            for char in unicodedata.normalize("NFKD", normalized)
+            if not unicodedata.combining(char)
+        )
 
     # Remove parentheses and content (e.g., "(Le Court) Pienaar" -> "Pienaar")
-    normalized = re.sub(r"\([^)]*\)\s*", "", normalized)
+    if "(" in normalized:
+        normalized = _PARENTHESES_RE.sub("", normalized)
 
     # Handle name order variations (Last, First -> First Last)
     if "," in normalized:
@@ -53,9 +90,8 @@ def normalize_rider_name(name: str) -> str:
             normalized = f"{parts[1]} {parts[0]}"
 
     # Remove common suffixes/prefixes
-    suffixes = ["jr", "sr", "ii", "iii"]
     words = normalized.split()
-    words = [w for w in words if w not in suffixes]
+    words = [w for w in words if w not in _NAME_SUFFIXES]
     normalized = " ".join(words)
 
     return normalized
@@ -75,79 +111,214 @@ def calculate_name_similarity(name1: str, name2: str) -> float:
     if not name1 or not name2:
         return 0.0
 
-    norm1 = normalize_rider_name(name1)
-    norm2 = normalize_rider_name(name2)
+    return _normalized_similarity(normalize_rider_name(name1), normalize_rider_name(name2))
 
+
+def _normalized_similarity(norm1: str, norm2: str) -> float:
+    """Calculate similarity between two names already passed through normalize_rider_name."""
     if norm1 == norm2:
         return 1.0
 
-    # Use sequence matcher for fuzzy matching
-    similarity = SequenceMatcher(None, norm1, norm2).ratio()
+    # WRatio blends token-set, token-sort and partial ratios, so surname/first-name
+    # order and shared name tokens are handled without extra heuristics. Jaro-Winkler
+    # is far cheaper but order-sensitive, and scores abbreviated fantasy names
+    # ("l. kopecky") well below any usable threshold
+    return fuzz.WRatio(norm1, norm2) / 100.0
+
+
+def _token_prefixes(normalized: str) -> frozenset[str]:
+    """Blocking keys of a normalized name: the leading letters of each of its tokens."""
+    return frozenset(word[:_BLOCK_PREFIX_LENGTH] for word in normalized.split())
+
+
+class NameIndex:
+    """
+    Precomputed lookups over a fixed list of candidate names.
+
+    Build once per candidate list and reuse it across searches. It holds the
+    normalized names, an exact-match table and a blocking index keyed by the
+    first few letters of each name token.
+    """
+
+    def __init__(self, candidate_names: list[str]):
+        """
+        Index a list of candidate names.
+
+        Args:
+            candidate_names: List of names to index
+        """
+        self.names = candidate_names
+        self.normalized = [normalize_rider_name(candidate) for candidate in candidate_names]
+        self.exact: dict[str, int] = {}
+        self.blocks: dict[str, list[int]] = defaultdict(list)
+        self._merged_blocks: dict[frozenset[str], tuple[list[int], list[str]]] = {}
+
+        for position, normalized in enumerate(self.normalized):
+            if not normalized:
+                continue
+            self.exact.setdefault(normalized, position)
+            for prefix in _token_prefixes(normalized):
+                self.blocks[prefix].append(position)
+
+    def blocked_candidates(self, normalized_search: str) -> tuple[list[int], list[str]]:
+        """
+        Candidates sharing at least one token prefix with the search name.
+
+        Returns:
+            Tuple of (candidate positions, normalized candidate names), in index order
+        """
+        prefixes = _token_prefixes(normalized_search)
+
+        # Searches often repeat a prefix combination, so merge each one once
+        merged = self._merged_blocks.get(prefixes)
+        if merged is None:
+            # Keep candidate order so ties resolve the same way as a full scan
+            positions = sorted(set().union(*(self.blocks.get(prefix, ()) for prefix in prefixes)))
+            merged = (positions, [self.normalized[position] for position in positions])
+            self._merged_blocks[prefixes] = merged
+        return merged
+
+
+# Pipeline reruns rebuild the index but ask for the same batch of names, so whole score
+# matrices are memoized. Keys are the names themselves, so refetched results can't hit a
+# stale entry, and the read-only arrays can be shared safely
+@lru_cache(maxsize=16)
+def _score_name_batch(
+    normalized_names: tuple[str, ...],
+    race_names: tuple[str, ...],
+    score_cutoff: float,
+    workers: int,
+) -> np.ndarray:
+    """Read-only WRatio similarities (0.0 to 1.0) of each name against each race name."""
+    scores = process.cdist(
+        normalized_names,
+        race_names,
+        scorer=fuzz.WRatio,
+        processor=None,
+        score_cutoff=score_cutoff,
+        dtype=np.float64,
+        workers=workers,
+    )
+    scores /= 100.0
+    scores.flags.writeable = False
+    return scores
+
+
+class StageResultsIndex:
+    """
+    Precomputed lookups over the rider names in a race's completed stage results.
+
+    Build once per race and reuse it for every rider. Each distinct rider name is
+    normalized once, and every stage maps its result rows onto those names, so a
+    name scored against the distinct list can be read off for every stage at once.
+    """
+
+    def __init__(self, race_data: RaceData):
+        """
+        Index the completed stages of a race.
+
+        Args:
+            race_data: Complete race data with stages
+        """
+        name_positions: dict[str, int] = {}
+        self.stages: list[tuple[list[dict[str, Any]], np.ndarray]] = []
+        self.exact_results: dict[str, dict[str, Any]] = {}
+
+        for stage in race_data.get("stages", []):
+            stage_results = stage.get("results")
+            if not stage_results:
+                continue
+
+            positions = np.empty(len(stage_results), dtype=np.intp)
+            for row, result in enumerate(stage_results):
+                normalized = normalize_rider_name(result.get("rider_name", ""))
+                positions[row] = name_positions.setdefault(normalized, len(name_positions))
+                if normalized:
+                    # First result row for each name, for exact lookups
+                    self.exact_results.setdefault(normalized, result)
+
+            self.stages.append((stage_results, positions))
+
+        self.names = tuple(name_positions)
+
+        # Read-only score rows per score cutoff, filled lazily by score_names
+        self._score_rows: dict[float, dict[str, np.ndarray]] = {}
+
+    def score_names(
+        self,
+        normalized_names: list[str],
+        score_cutoff: float,
+        workers: int | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Score names against this race's distinct rider names, batching every new name.
+
+        Rows are kept on the index, so a batch scored up front serves the per-rider
+        lookups that follow without another cdist call. Batches are also memoized
+        across indexes, so a rerun over the same race and names skips cdist entirely.
 
-    # Boost similarity if last names match exactly
-    words1 = norm1.split()
-    words2 = norm2.split()
+        Args:
+            normalized_names: Names already passed through normalize_rider_name
+            score_cutoff: Scores (0-100) below this are set to 0
+            workers: Number of threads cdist may use (-1 for all cores). Defaults to all
+                cores for large batches and a single thread for small ones
 
-    if words1 and words2:
-        # Check if last names match (assuming last word is surname)
-        if words1[-1] == words2[-1]:
-            similarity = min(1.0, similarity + 0.2)
+        Returns:
+            Dict mapping each requested name to its read-only row of similarities
+            (0.0 to 1.0)
+        """
+        rows = self._score_rows.setdefault(score_cutoff, {})
+        requested = list(dict.fromkeys(normalized_names))
 
-        # Check if any word matches exactly
-        if any(word in words2 for word in words1):
-            similarity = min(1.0, similarity + 0.1)
+        missing = [name for name in requested if name not in rows]
+        if missing and self.names:
+            if workers is None:
+                cells = len(missing) * len(self.names)
+                workers = -1 if cells >= _PARALLEL_CDIST_MIN_CELLS else 1
 
-    return similarity
+            scores = _score_name_batch(tuple(missing), self.names, score_cutoff, workers)
+            rows.update(zip(missing, scores, strict=True))
+
+        return {name: rows[name] for name in requested if name in rows}
 
 
 def find_best_match(
-    search_name: str, candidate_names: list[str], threshold: float = 0.8
+    search_name: str,
+    candidate_names: list[str],
+    threshold: float = 0.8,
+    index: NameIndex | None = None,
 ) -> tuple[str | None, float]:
     """
     Find the best matching name from a list of candidates.
 
+    Exact normalized matches are looked up directly. Otherwise only candidates
+    sharing a token prefix with the search name are scored, and the full list is
+    scored only if none of them reaches the threshold.
+
     Args:
         search_name: Name to search for
         candidate_names: List of names to match against
         threshold: Minimum similarity threshold
+        index: Prebuilt NameIndex of candidate_names, for callers searching the same
+            candidates repeatedly
 
     Returns:
-        Tuple of (best_match_name, confidence_score)
+        Tuple of (best_match_name, confidence_score), or (None, 0.0) when no
+        candidate reaches the threshold
     """
     if not search_name or not candidate_names:
         return None, 0.0
 
-    best_match = None
-    best_score = 0.0
-    high_scores = []
+    if index is None:
+        index = NameIndex(candidate_names)
 
-    for candidate in candidate_names:
-        if not candidate:
-            continue
-
-        try:
-            score = calculate_name_similarity(search_name, candidate)
-            if score > best_score:
-                best_score = score
-                best_match = candidate
-
-            # Track high-scoring matches for debugging
-            if score >= 0.7:  # Lower threshold for debug logging
-                high_scores.append((candidate, score))
-
-        except Exception as e:
-            logging.warning(f"Error comparing '{search_name}' with '{candidate}': {e}")
-            continue
-
-    # # Log detailed matching info if there are interesting matches
-    # if high_scores:
-    #     high_scores.sort(key=lambda x: x[1], reverse=True)
-    #     top_matches = high_scores[:3]  # Show top 3 matches
-    #     matches_str = ", ".join([f"'{name}' ({score:.3f})" for name, score in top_matches])
-    #     logging.debug(f"🔍 Name matching for '{search_name}': top matches = {matches_str}")
+    best_position, best_score = _find_best_position(
+        normalize_rider_name(search_name), index, threshold
+    )
+    best_match = candidate_names[best_position] if best_position is not None else None
 
     # Return match only if it exceeds threshold
-    if best_score >= threshold:
+    if best_match is not None:
         # logging.debug(
         #     f"✅ Best match for '{search_name}': '{best_match}' (score: {
         #         best_score:.3f}, threshold: {threshold})"
@@ -162,6 +333,119 @@ def find_best_match(
     return None, best_score
 
 
+def _find_best_position(
+    normalized_search: str, index: NameIndex, threshold: float
+) -> tuple[int | None, float]:
+    """Position and score of the best indexed candidate at or above the threshold."""
+    # An exact normalized hit is always the best possible match
+    exact_position = index.exact.get(normalized_search)
+    if exact_position is not None:
+        return exact_position, 1.0
+
+    # The cutoff lets RapidFuzz skip candidates that can no longer reach the threshold
+    score_cutoff = threshold * 100
+    blocked_positions, blocked_names = index.blocked_candidates(normalized_search)
+    best_position, best_score = _extract_best(
+        normalized_search, blocked_names, score_cutoff, blocked_positions
+    )
+    if best_position is None and len(blocked_positions) < len(index.names):
+        best_position, best_score = _extract_best(
+            normalized_search, index.normalized, score_cutoff
+        )
+
+    return best_position, best_score
+
+
+def _extract_best(
+    normalized_search: str,
+    choices: list[str],
+    score_cutoff: float,
+    positions: list[int] | None = None,
+) -> tuple[int | None, float]:
+    """Score a search name against choices, mapping the winner back through positions."""
+    result = process.extractOne(
+        normalized_search,
+        choices,
+        scorer=fuzz.WRatio,
+        processor=None,
+        score_cutoff=score_cutoff,
+    )
+    if result is None:
+        return None, 0.0
+
+    _, score, choice_position = result
+    best_position = choice_position if positions is None else positions[choice_position]
+    return best_position, score / 100.0
+
+
+def _find_best_positions(
+    search_names: list[str],
+    index: NameIndex,
+    threshold: float = 0.8,
+    workers: int | None = None,
+) -> list[tuple[int | None, float]]:
+    """
+    Position and score of the best indexed candidate for each search name.
+
+    Exact normalized names are looked up; every other name is scored against all
+    candidates in one cdist batch. There is no prefix blocking, so the winner can
+    differ from find_best_match, which settles on the best blocked candidate.
+    """
+    results: list[tuple[int | None, float]] = [(None, 0.0)] * len(search_names)
+    fuzzy_rows: list[int] = []
+    fuzzy_searches: list[str] = []
+    for row, search_name in enumerate(search_names):
+        if not search_name:
+            continue
+        normalized_search = normalize_rider_name(search_name)
+        exact_position = index.exact.get(normalized_search)
+        if exact_position is not None:
+            results[row] = (exact_position, 1.0)
+        else:
+            fuzzy_rows.append(row)
+            fuzzy_searches.append(normalized_search)
+
+    if not fuzzy_rows or not index.names:
+        return results
+
+    normalized_candidates = index.normalized
+
+    if workers is None:
+        cells = len(fuzzy_searches) * len(normalized_candidates)
+        workers = -1 if cells >= _PARALLEL_CDIST_MIN_CELLS else 1
+
+    # Score in row chunks so very large batches never hold the whole matrix at once
+    chunk_rows = max(1, _MAX_CDIST_CELLS // len(normalized_candidates))
+    for start in range(0, len(fuzzy_rows), chunk_rows):
+        chunk_searches = fuzzy_searches[start : start + chunk_rows]
+        scores = _similarity_matrix(chunk_searches, normalized_candidates, workers)
+        best_indices = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(chunk_searches)), best_indices]
+
+        chunk_fuzzy_rows = fuzzy_rows[start : start + chunk_rows]
+        for row, position, score in zip(chunk_fuzzy_rows, best_indices, best_scores, strict=True):
+            if score >= threshold:
+                results[row] = (int(position), float(score))
+
+    return results
+
+
+def _similarity_matrix(
+    normalized_searches: list[str], normalized_candidates: list[str], workers: int = 1
+) -> np.ndarray:
+    """Vectorized _normalized_similarity over every search/candidate pair."""
+    scores = process.cdist(
+        normalized_searches,
+        normalized_candidates,
+        scorer=fuzz.WRatio,
+        processor=None,
+        dtype=np.float64,
+        workers=workers,
+    )
+    scores /= 100.0
+    return scores
+
+
 # =============================================================================
 # Unified Matching System
 # =============================================================================
@@ -200,12 +484,17 @@ class RiderMatcher:
         fantasy_has_teams = any(rider.get("team") for rider in fantasy_riders)
         startlist_has_teams = any(rider.get("team_name") for rider in startlist_riders)
 
+        # Read the startlist name column once; both strategies match against it by position
+        startlist_names = [rider.get("rider_name", "") for rider in startlist_riders]
+
         if fantasy_has_teams and startlist_has_teams:
             # logging.debug(
             #     f"🏆 Using team-based matching: {len(fantasy_riders)} fantasy riders across te
             #     ams"
             # )
-            matches = self._match_by_team_and_name(fantasy_riders, startlist_riders)
+            matches = self._match_by_team_and_name(
+                fantasy_riders, startlist_riders, startlist_names
+            )
         else:
             # logging.debug(
             #     f"📝 Using name-only matching: fantasy_teams={fantasy_has_teams}, 
@@ -213,7 +502,7 @@ class RiderMatcher:
             #         startlist_has_teams
             #     }"
             # )
-            matches = self._match_by_name_only(fantasy_riders, startlist_riders)
+            matches = self._match_by_name_only(fantasy_riders, startlist_riders, startlist_names)
 
         # logging.debug(
         #     f"🔗 Fantasy-to-startlist matching: {len(matches)} successful matches out of {
@@ -223,7 +512,10 @@ class RiderMatcher:
         return matches
 
     def match_fantasy_to_race_results(
-        self, fantasy_rider: dict[str, Any], race_data: RaceData
+        self,
+        fantasy_rider: dict[str, Any],
+        race_data: RaceData,
+        race_index: StageResultsIndex | None = None,
     ) -> RiderMatchingResult:
         """
         Match a fantasy rider to race stage results.
@@ -231,6 +523,8 @@ class RiderMatcher:
         Args:
             fantasy_rider: Fantasy rider data
             race_data: Complete race data with stages
+            race_index: Prebuilt StageResultsIndex of race_data, for callers matching
+                many riders against the same race
 
         Returns:
             RiderMatchingResult with match information
@@ -240,8 +534,7 @@ class RiderMatcher:
         pcs_name = pcs_data.get("name", "") if pcs_data else ""
 
         # Try multiple name sources for matching
-        candidate_names = [fantasy_name, pcs_name, fantasy_rider.get("full_name", "")]
-        candidate_names = [name for name in candidate_names if name]
+        candidate_names = self._race_candidate_names(fantasy_rider)
 
         # logging.debug(
         #     f"🏁 Race matching for '{fantasy_name}': trying {len(candidate_names)} name variants"
@@ -255,79 +548,86 @@ class RiderMatcher:
 
         best_match = None
         best_confidence = 0.0
-        matched_stages = 0
 
-        # Try to find rider in completed stages
-        stages = race_data.get("stages", [])
-        completed_stages = [s for s in stages if s.get("results")]
+        # Score each name variant once against every distinct stage rider name, so the
+        # query is preprocessed once and each stage only reads its riders' scores
+        if race_index is None:
+            race_index = StageResultsIndex(race_data)
 
         # logging.debug(
-        #     f"📋 Searching {len(completed_stages)} completed stages for '{fantasy_name}'"
+        #     f"📋 Searching {len(race_index.stages)} completed stages for '{fantasy_name}'"
         # )
 
-        for name in candidate_names:
-            stage_matches = 0
-
-            for stage in stages:
-                stage_results = stage.get("results", None)
-                # Check if stage has results (is completed)
-                if not stage_results:
-                    continue
-
-                matched_rider, confidence = self._find_rider_in_stage_results(name, stage_results)
+        normalized_names = [normalize_rider_name(name) for name in candidate_names]
 
-                if matched_rider and confidence >= self.fuzzy_threshold:
-                    stage_matches += 1
-
-                    if not best_match or confidence > best_confidence:
-                        best_match = matched_rider
-                        best_confidence = confidence
-
-            if stage_matches > matched_stages:
-                matched_stages = stage_matches
-                # logging.debug(
-                #     f"🎯 Found '{name}' in {stage_matches} stages (confidence: {
-                #         best_confidence:.3f})"
-                # )
-
-        # Determine match method and canonical name
-        match_method = "no_match"
-        canonical_name = fantasy_name
-
-        if best_match:
-            if best_confidence == 1.0:
-                match_method = "exact"
-            elif best_confidence >= 0.9:
-                match_method = "high_confidence_fuzzy"
-            else:
-                match_method = "fuzzy"
-
-            canonical_name = best_match.get("rider_name", "")
+        # Only identical names score 1.0 and nothing beats it, so the first variant found
+        # verbatim in the race settles the match exactly as the fuzzy scan would
+        exact_name = next(
+            (name for name in normalized_names if name in race_index.exact_results), None
+        )
+        if exact_name is not None:
+            best_match = race_index.exact_results[exact_name]
+            best_confidence = 1.0
+        elif race_index.stages:
+            name_rows = race_index.score_names(normalized_names, self.fuzzy_threshold * 100)
+
+            # Every distinct name appears in some stage, so a variant's best over all stages
+            # is its row maximum. Only the first variant reaching the overall best needs a
+            # stage scan, which keeps the first best in variant-then-stage order
+            variant_best = [float(name_rows[name].max()) for name in normalized_names]
+            top_score = max(variant_best)
+
+            if top_score >= self.fuzzy_threshold and top_score > 0:
+                name_scores = name_rows[normalized_names[variant_best.index(top_score)]]
+                for stage_results, positions in race_index.stages:
+                    best_match, best_confidence = self._find_rider_in_stage_results(
+                        name_scores, stage_results, positions
+                    )
+                    if best_confidence == top_score:
+                        break
+
+        if not best_match:
             # logging.debug(
-            #     f"✅ Race match for '{fantasy_name}': '{canonical_name}' ({match_method}, {
-            #         best_confidence:.3f}, {matched_stages} stages)"
+            #     f"❌ No race match found for '{fantasy_name}' (searched {
+            #         len(race_index.stages)
+            #     } stages)"
             # )
-        # else:
-        #     logging.debug(
-        #         f"❌ No race match found for '{fantasy_name}' (searched {
-        #             len(completed_stages)
-        #         } stages)"
-        #     )
+            # Only the fields known without a stage result; the rest keep their defaults
+            return RiderMatchingResult(
+                fantasy_name=fantasy_name,
+                pcs_name=pcs_name,
+                rider_url=pcs_data.get("rider_url"),
+                match_confidence=best_confidence,
+                canonical_name=fantasy_name,
+                nationality=pcs_data.get("nationality"),
+            )
+
+        # Determine match method and canonical name
+        if best_confidence == 1.0:
+            match_method = "exact"
+        elif best_confidence >= 0.9:
+            match_method = "high_confidence_fuzzy"
+        else:
+            match_method = "fuzzy"
+
+        canonical_name = best_match.get("rider_name", "")
+        # logging.debug(
+        #     f"✅ Race match for '{fantasy_name}': '{canonical_name}' ({match_method}, {
+        #         best_confidence:.3f})"
+        # )
 
         return RiderMatchingResult(
             fantasy_name=fantasy_name,
             pcs_name=pcs_name,
-            stage_name=best_match.get("rider_name") if best_match else None,
-            rider_url=(best_match.get("rider_url") if best_match else pcs_data.get("rider_url")),
+            stage_name=best_match.get("rider_name"),
+            rider_url=best_match.get("rider_url"),
             match_confidence=best_confidence,
             match_method=match_method,
             canonical_name=canonical_name,
-            team_name=best_match.get("team_name") if best_match else None,
-            rider_number=best_match.get("rider_number") if best_match else None,
-            nationality=(
-                best_match.get("nationality") if best_match else pcs_data.get("nationality")
-            ),
-            age=best_match.get("age") if best_match else None,
+            team_name=best_match.get("team_name"),
+            rider_number=best_match.get("rider_number"),
+            nationality=best_match.get("nationality"),
+            age=best_match.get("age"),
         )
 
     def match_all_riders(
@@ -352,47 +652,61 @@ class RiderMatcher:
         # Step 1: Match fantasy to startlist/PCS
         startlist_matches = self.match_fantasy_to_startlist(fantasy_riders, startlist_riders)
 
-        # Step 2: Create enriched rider data with PCS information
+        # Step 2: Enrich riders with PCS information in one pass, also collecting the name
+        # variants that need fuzzy race matching so they can be scored in one batch
+        race_index = StageResultsIndex(race_data)
         enriched_riders = []
+        fuzzy_names = []
+
         for rider in fantasy_riders:
+            # Riders without a fantasy name can't be keyed in the results
+            fantasy_name = rider.get("fantasy_name", "")
+            if not fantasy_name:
+                continue
+
             enriched_rider = rider.copy()
             full_name = rider.get("full_name", "")
 
             # Add startlist match information
-            if full_name in startlist_matches:
-                match_info = startlist_matches[full_name]
-                enriched_rider.update(
-                    {
-                        "matched_startlist_rider": match_info.get("matched_startlist_rider", {}),
-                        "pcs_matched_name": match_info.get("pcs_matched_name", ""),
-                        "pcs_rider_url": match_info.get("pcs_rider_url", ""),
-                    }
+            match_info = startlist_matches.get(full_name)
+            if match_info is not None:
+                rider_url = match_info.get("pcs_rider_url", "")
+                enriched_rider["matched_startlist_rider"] = match_info.get(
+                    "matched_startlist_rider", {}
                 )
+                enriched_rider["pcs_matched_name"] = match_info.get("pcs_matched_name", "")
+                enriched_rider["pcs_rider_url"] = rider_url
 
                 # Add PCS data if available in cache
-                rider_url = match_info.get("pcs_rider_url", "")
-                if rider_url and rider_url in pcs_cache:
-                    enriched_rider["pcs_data"] = pcs_cache[rider_url]
+                pcs_data = pcs_cache.get(rider_url) if rider_url else None
+                if pcs_data is not None:
+                    enriched_rider["pcs_data"] = pcs_data
 
-            enriched_riders.append(enriched_rider)
+            enriched_riders.append((fantasy_name, full_name, enriched_rider, match_info))
+
+            normalized_names = [
+                normalize_rider_name(name) for name in self._race_candidate_names(enriched_rider)
+            ]
+            if not any(name in race_index.exact_results for name in normalized_names):
+                fuzzy_names.extend(normalized_names)
+
+        race_index.score_names(fuzzy_names, self.fuzzy_threshold * 100)
 
         # Step 3: Match enriched riders to race results
         final_matches = {}
-        for rider in enriched_riders:
-            fantasy_name = rider.get("fantasy_name", "")
-            if not fantasy_name:
-                continue
-
-            race_match = self.match_fantasy_to_race_results(rider, race_data)
+        for fantasy_name, full_name, rider, match_info in enriched_riders:
+            race_match = self.match_fantasy_to_race_results(rider, race_data, race_index)
 
             # Combine all match information
             final_matches[fantasy_name] = {
                 "fantasy_rider": rider,
-                "startlist_match": startlist_matches.get(rider.get("full_name", "")),
+                "startlist_match": match_info,
                 "race_match": race_match,
                 "has_pcs_data": bool(rider.get("pcs_data")),
-                "has_race_data": race_match.get("match_confidence", 0.0) >= self.fuzzy_threshold,
-                "canonical_name": race_match.get("canonical_name", rider.get("full_name", "")),
+                "has_race_data": race_match.match_confidence >= self.fuzzy_threshold,
+                "canonical_name": (
+                    full_name if race_match.canonical_name is None else race_match.canonical_name
+                ),
             }
 
         return final_matches
@@ -401,26 +715,40 @@ class RiderMatcher:
     # Helper Methods
     # =============================================================================
 
+    def _race_candidate_names(self, fantasy_rider: dict[str, Any]) -> list[str]:
+        """Name variants of a fantasy rider to look for in stage results."""
+        pcs_data = fantasy_rider.get("pcs_data", {})
+        candidate_names = [
+            fantasy_rider.get("fantasy_name", ""),
+            pcs_data.get("name", "") if pcs_data else "",
+            fantasy_rider.get("full_name", ""),
+        ]
+        return [name for name in candidate_names if name]
+
     def _find_rider_in_stage_results(
-        self, rider_name: str, stage_results: list[dict[str, Any]]
+        self,
+        name_scores: np.ndarray,
+        stage_results: list[dict[str, Any]],
+        positions: np.ndarray,
     ) -> tuple[dict[str, Any] | None, float]:
-        """Find rider in stage results using name matching."""
-        if not rider_name or not stage_results:
+        """Find rider in stage results from their scores against the race's rider names."""
+        if not stage_results:
             return None, 0.0
 
-        result_names = [result.get("rider_name", "") for result in stage_results]
-        matched_name, confidence = find_best_match(rider_name, result_names, self.fuzzy_threshold)
-
-        if matched_name:
-            # Find the full result data
-            for result in stage_results:
-                if result.get("rider_name") == matched_name:
-                    return result, confidence
+        # First row with the highest score wins, as in find_best_match
+        stage_scores = name_scores[positions]
+        best_row = int(stage_scores.argmax())
+        confidence = float(stage_scores[best_row])
 
-        return None, confidence
+        if confidence >= self.fuzzy_threshold and confidence > 0:
+            return stage_results[best_row], confidence
+        return None, 0.0
 
     def _match_by_team_and_name(
-        self, fantasy_riders: list[dict[str, Any]], startlist_riders: list[dict[str, Any]]
+        self,
+        fantasy_riders: list[dict[str, Any]],
+        startlist_riders: list[dict[str, Any]],
+        startlist_names: list[str],
     ) -> dict[str, dict[str, Any]]:
         """Match riders using team information first, then names within teams."""
         matches = {}
@@ -433,94 +761,89 @@ class RiderMatcher:
                 fantasy_by_team[team] = []
             fantasy_by_team[team].append(rider)
 
-        startlist_by_team = {}
-        for rider in startlist_riders:
-            team = rider.get("team_name", "Unknown")
-            if team not in startlist_by_team:
-                startlist_by_team[team] = []
-            startlist_by_team[team].append(rider)
+        # Group startlist row positions rather than riders, so names come from the column
+        startlist_by_team = defaultdict(list)
+        for position, rider in enumerate(startlist_riders):
+            startlist_by_team[rider.get("team_name", "Unknown")].append(position)
 
-        # Create team mappings using fuzzy matching
+        # Create team mappings using fuzzy matching, indexing the startlist teams once
         team_mappings = {}
-        fantasy_teams = set(fantasy_by_team.keys())
-        startlist_teams = set(startlist_by_team.keys())
+        startlist_teams = list(startlist_by_team)
+        startlist_team_index = NameIndex(startlist_teams)
 
-        for fantasy_team in fantasy_teams:
-            best_match, _ = find_best_match(fantasy_team, list(startlist_teams))
+        for fantasy_team in fantasy_by_team:
+            best_match, _ = find_best_match(
+                fantasy_team, startlist_teams, index=startlist_team_index
+            )
             if best_match:
                 team_mappings[fantasy_team] = best_match
 
         # Match riders within matched teams
+        unmatched_team_riders = []
         for fantasy_team, team_riders in fantasy_by_team.items():
             if fantasy_team not in team_mappings:
-                # Fallback to name-only matching for unmatched teams
-                for rider in team_riders:
-                    self._try_match_rider_by_name(rider, startlist_riders, matches)
+                unmatched_team_riders.extend(team_riders)
                 continue
 
             startlist_team = team_mappings[fantasy_team]
             if startlist_team not in startlist_by_team:
                 continue
 
-            startlist_riders_for_team = startlist_by_team[startlist_team]
-
-            for rider in team_riders:
-                full_name = rider.get("full_name", "")
-                if not full_name:
-                    continue
-
-                # Find best match within the team
-                startlist_names = [r.get("rider_name", "") for r in startlist_riders_for_team]
-                matched_name, _ = find_best_match(full_name, startlist_names)
+            team_positions = startlist_by_team[startlist_team]
+
+            # Find best matches within the team in one batch. Per-team matrices stay tiny,
+            # whereas one fantasy x startlist matrix masked by team would score every
+            # cross-team pair only to discard it
+            full_names = [name for name in (r.get("full_name") for r in team_riders) if name]
+            matches.update(
+                self._match_names_to_riders(
+                    full_names,
+                    [startlist_riders[position] for position in team_positions],
+                    [startlist_names[position] for position in team_positions],
+                )
+            )
 
-                if matched_name:
-                    # Find the full PCS rider data
-                    for pcs_rider in startlist_riders_for_team:
-                        if pcs_rider.get("rider_name") == matched_name:
-                            matches[full_name] = {
-                                "matched_startlist_rider": pcs_rider,
-                                "pcs_matched_name": matched_name,
-                                "pcs_rider_url": pcs_rider.get("rider_url"),
-                            }
-                            break
+        # Fallback to name-only matching for unmatched teams, batched in one pass
+        if unmatched_team_riders:
+            matches.update(
+                self._match_by_name_only(unmatched_team_riders, startlist_riders, startlist_names)
+            )
 
         return matches
 
     def _match_by_name_only(
-        self, fantasy_riders: list[dict[str, Any]], startlist_riders: list[dict[str, Any]]
+        self,
+        fantasy_riders: list[dict[str, Any]],
+        startlist_riders: list[dict[str, Any]],
+        startlist_names: list[str],
     ) -> dict[str, dict[str, Any]]:
         """Match riders by name only when team information is not available."""
+        full_names = [name for name in (r.get("full_name") for r in fantasy_riders) if name]
+        return self._match_names_to_riders(full_names, startlist_riders, startlist_names)
+
+    def _match_names_to_riders(
+        self,
+        full_names: list[str],
+        startlist_riders: list[dict[str, Any]],
+        startlist_names: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Match fantasy full names to startlist riders, given their aligned name column."""
         matches = {}
 
-        for rider in fantasy_riders:
-            self._try_match_rider_by_name(rider, startlist_riders, matches)
+        # The index lines up with startlist_riders, so a match position is the rider itself
+        startlist_index = NameIndex(startlist_names)
+        best_positions = _find_best_positions(full_names, startlist_index)
 
-        return matches
+        for full_name, (position, _) in zip(full_names, best_positions, strict=True):
+            if position is not None:
+                pcs_rider = startlist_riders[position]
+                matches[full_name] = {
+                    "matched_startlist_rider": pcs_rider,
+                    "pcs_matched_name": startlist_index.names[position],
+                    "pcs_rider_url": pcs_rider.get("rider_url"),
+                }
 
-    def _try_match_rider_by_name(
-        self,
-        rider: dict[str, Any],
-        startlist_riders: list[dict[str, Any]],
-        matches: dict[str, dict[str, Any]],
-    ) -> None:
-        """Attempt to match a single rider by name."""
-        full_name = rider.get("full_name", "")
-        if not full_name:
-            return
-
-        startlist_names = [r.get("rider_name", "") for r in startlist_riders]
-        matched_name, _ = find_best_match(full_name, startlist_names)
-
-        if matched_name:
-            # Find the full PCS rider data
-            for pcs_rider in startlist_riders:
-                if pcs_rider.get("rider_name") == matched_name:
-                    matches[full_name] = {
-                        "matched_startlist_rider": pcs_rider,
-                        "pcs_matched_name": matched_name,
-                        "pcs_rider_url": pcs_rider.get("rider_url"),
-                    }
-                    break
+        return matches
 
 
 # =============================================================================
@@ -586,3 +909,50 @@ def match_all_data_sources(
     # )
 
     return matches
+
+
+def match_fantasy_to_race_data(
+    fantasy_rider: dict[str, Any], race_data: RaceData, fuzzy_threshold: float = 0.8
+) -> dict[str, Any]:
+    """
+    Match a single fantasy rider to race stage results.
+
+    Args:
+        fantasy_rider: Fantasy rider data, optionally with pcs_data
+        race_data: Complete race data with stages
+        fuzzy_threshold: Minimum similarity for fuzzy matches
+
+    Returns:
+        Dict of RiderMatchingResult fields; canonical_name is the rider's name as it
+        appears in the stage results, or the fantasy name when no match is found
+    """
+    matcher = create_rider_matcher(fuzzy_threshold)
+    return asdict(matcher.match_fantasy_to_race_results(fantasy_rider, race_data))
+
+
+def extract_rider_from_classifications(
+    rider_name: str, stage_data: StageData
+) -> dict[str, dict[str, Any]]:
+    """
+    Find a rider's row in each classification of a stage.
+
+    Args:
+        rider_name: Rider name as it appears in the stage results
+        stage_data: Stage data with results and classification lists
+
+    Returns:
+        Dict mapping "results", "gc", "points", "kom" and "youth" to {"data": row} for
+        each classification the rider appears in; empty if the rider is in none
+    """
+    normalized_name = normalize_rider_name(rider_name)
+    if not normalized_name:
+        return {}
+
+    classifications = {}
+    for classification, stage_key in _STAGE_CLASSIFICATION_KEYS.items():
+        for row in stage_data.get(stage_key) or []:
+            if normalize_rider_name(row.get("rider_name", "")) == normalized_name:
+                classifications[classification] = {"data": row}
+                break
+
+    return classifications
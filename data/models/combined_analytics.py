@@ -5,6 +5,7 @@ These models support combining rider season results with detailed race stage dat
 to provide more accurate and nuanced performance analytics.
 """
 
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
 
@@ -141,21 +142,27 @@ class RaceAnalyticsSummary(TypedDict, total=False):
     competitive_balance: float | None  # How spread out the field is
 
 
-class RiderMatchingResult(TypedDict, total=False):
-    """Result of matching a rider across data sources."""
+@dataclass(slots=True)
+class RiderMatchingResult:
+    """
+    Result of matching a rider across data sources.
 
-    fantasy_name: str | None
-    pcs_name: str | None
-    stage_name: str | None
-    rider_url: str | None
+    A slotted dataclass rather than a TypedDict: one is built per rider on every
+    matching run and its fields are read in the analytics loops.
+    """
 
-    match_confidence: float  # 0.0 to 1.0
-    match_method: str  # "exact", "fuzzy", "manual"
-    ambiguous_matches: list[str]  # Other possible matches
+    fantasy_name: str | None = None
+    pcs_name: str | None = None
+    stage_name: str | None = None
+    rider_url: str | None = None
+
+    match_confidence: float = 0.0  # 0.0 to 1.0
+    match_method: str = "no_match"  # "exact", "fuzzy", "manual"
+    ambiguous_matches: list[str] = field(default_factory=list)  # Other possible matches
 
     # Unified rider data
-    canonical_name: str
-    team_name: str | None
-    rider_number: int | None
-    nationality: str | None
-    age: int | None
+    canonical_name: str | None = None
+    team_name: str | None = None
+    rider_number: int | None = None
+    nationality: str | None = None
+    age: int | None = None
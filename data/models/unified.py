@@ -9,6 +9,7 @@ This module defines clear data structures for each stage of the pipeline:
 These models provide type safety and clear contracts between pipeline stages.
 """
 
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
 import pandas as pd
@@ -101,41 +102,45 @@ class AnalyticsDataSet(TypedDict, total=False):
 # =============================================================================
 
 
-class PipelineStage(TypedDict, total=False):
+@dataclass(slots=True)
+class PipelineStage:
     """Metadata about a pipeline stage."""
 
     stage_name: str
     start_time: str
-    end_time: str | None
-    success: bool
-    error_message: str | None
-    items_processed: int
-    items_succeeded: int
+    start_time_perf: float  # time.perf_counter() readings, for durations
+    end_time: str | None = None
+    end_time_perf: float | None = None
+    success: bool = False
+    error_message: str | None = None
+    items_processed: int = 0
+    items_succeeded: int = 0
 
 
-class PipelineState(TypedDict, total=False):
-    """Complete state of the data pipeline."""
+@dataclass(slots=True)
+class PipelineState:
+    """Complete state of the data pipeline, updated in place as stages run."""
 
     # Configuration
     race_key: str
-    use_enhanced_analytics: bool
-    fuzzy_threshold: float
+    use_enhanced_analytics: bool = True
+    fuzzy_threshold: float = 0.8
 
     # Stage tracking
-    pipeline_stages: list[PipelineStage]
-    current_stage: str | None
-    overall_success: bool
+    pipeline_stages: list[PipelineStage] = field(default_factory=list)
+    current_stage: str | None = None
+    overall_success: bool = False
 
     # Data at each stage
-    raw_data: RawDataSources | None
-    matched_data: MatchedDataSet | None
-    analytics_data: AnalyticsDataSet | None
+    raw_data: RawDataSources | None = None
+    matched_data: MatchedDataSet | None = None
+    analytics_data: AnalyticsDataSet | None = None
 
     # Summary metrics
-    total_fantasy_riders: int
-    matched_riders_count: int
-    enhanced_analytics_count: int
-    data_quality_distribution: dict[str, int]
+    total_fantasy_riders: int = 0
+    matched_riders_count: int = 0
+    enhanced_analytics_count: int = 0
+    data_quality_distribution: dict[str, int] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -183,31 +188,37 @@ class AnalyticsResult(TypedDict, total=False):
 # =============================================================================
 
 
-class PipelineConfig(TypedDict, total=False):
-    """Configuration for the data pipeline."""
+@dataclass(slots=True, frozen=True)
+class PipelineConfig:
+    """
+    Configuration for the data pipeline.
+
+    Frozen so a config can't change under a running pipeline; use
+    dataclasses.replace to derive a modified copy.
+    """
 
     # Data sources
     race_key: str
-    use_cache: bool
-    force_refresh: bool
+    use_cache: bool = True
+    force_refresh: bool = False
 
     # Matching configuration
-    fuzzy_threshold: float
-    require_team_match: bool
+    fuzzy_threshold: float = 0.8
+    require_team_match: bool = True
 
     # Analytics configuration
-    use_enhanced_analytics: bool
-    calculate_trends: bool
-    include_comparisons: bool
+    use_enhanced_analytics: bool = True
+    calculate_trends: bool = True
+    include_comparisons: bool = False
 
     # Performance options
-    parallel_processing: bool
-    batch_size: int
-    api_delay: float
+    parallel_processing: bool = False
+    batch_size: int = 10
+    api_delay: float = 0.5
 
     # Output options
-    include_debug_info: bool
-    verbose_logging: bool
+    include_debug_info: bool = True
+    verbose_logging: bool = True
 
 
 # =============================================================================
@@ -18,8 +18,11 @@ Key benefits:
 """
 
 import logging
+import time
 from collections.abc import Callable
+from dataclasses import asdict, replace
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -48,6 +51,8 @@ from data.models.unified import (
 # =============================================================================
 
 
+# PipelineConfig is frozen, so every caller can safely share one default per race
+@lru_cache(maxsize=32)
 def create_default_config(race_key: str) -> PipelineConfig:
     """
     Create default pipeline configuration.
@@ -75,6 +80,10 @@ def create_default_config(race_key: str) -> PipelineConfig:
     )
 
 
+def _ignore_progress(progress: float, text: str) -> None:
+    """Progress callback used when the caller doesn't track progress."""
+
+
 # =============================================================================
 # Main Pipeline Class
 # =============================================================================
@@ -92,23 +101,14 @@ class DataPipeline:
         Args:
             config: Pipeline configuration
         """
-        race_key = config.get("race_key")
-        if race_key is None:
-            raise ValueError("Missing required config: race_key")
-
         self.config = config
         self.state = PipelineState(
-            race_key=race_key,
-            use_enhanced_analytics=config.get("use_enhanced_analytics", True),
-            fuzzy_threshold=config.get("fuzzy_threshold", 0.8),
-            pipeline_stages=[],
-            current_stage=None,
-            overall_success=False,
-            total_fantasy_riders=0,
-            matched_riders_count=0,
-            enhanced_analytics_count=0,
-            data_quality_distribution={},
+            race_key=config.race_key,
+            use_enhanced_analytics=config.use_enhanced_analytics,
+            fuzzy_threshold=config.fuzzy_threshold,
         )
+        # Latest stage record per name, so completing a stage needn't scan the list
+        self._stages_by_name: dict[str, PipelineStage] = {}
 
     def run(self, progress_callback: Callable[[float, str], None] | None = None) -> DataLoadResult:
         """
@@ -120,13 +120,16 @@ class DataPipeline:
         Returns:
             Complete pipeline results
         """
+        # Report into a no-op when no callback is given, so stages can call it unconditionally
+        if progress_callback is None:
+            progress_callback = _ignore_progress
+
         # Run pipeline stages with granular error handling
         self._start_pipeline_stage("loading")
         try:
-            if progress_callback:
-                progress_callback(0.05, "Starting data loading...")
+            progress_callback(0.05, "Starting data loading...")
             raw_data = self._load_raw_data(progress_callback)
-            self.state["raw_data"] = raw_data
+            self.state.raw_data = raw_data
             self._complete_pipeline_stage("loading", True)
         except Exception as e:
             self._complete_pipeline_stage("loading", False, str(e))
@@ -134,10 +137,9 @@ class DataPipeline:
 
         self._start_pipeline_stage("matching")
         try:
-            if progress_callback:
-                progress_callback(0.35, "Starting rider matching...")
+            progress_callback(0.35, "Starting rider matching...")
             matched_data = self._match_riders(raw_data, progress_callback)
-            self.state["matched_data"] = matched_data
+            self.state.matched_data = matched_data
             self._complete_pipeline_stage("matching", True)
         except Exception as e:
             self._complete_pipeline_stage("matching", False, str(e))
@@ -145,10 +147,9 @@ class DataPipeline:
 
         self._start_pipeline_stage("analytics")
         try:
-            if progress_callback:
-                progress_callback(0.60, "Starting analytics computation...")
+            progress_callback(0.60, "Starting analytics computation...")
             analytics_data = self._calculate_analytics(matched_data, raw_data, progress_callback)
-            self.state["analytics_data"] = analytics_data
+            self.state.analytics_data = analytics_data
             self._complete_pipeline_stage("analytics", True)
         except Exception as e:
             self._complete_pipeline_stage("analytics", False, str(e))
@@ -156,97 +157,91 @@ class DataPipeline:
 
         self._start_pipeline_stage("finalization")
         try:
-            if progress_callback:
-                progress_callback(0.90, "Preparing final results...")
+            progress_callback(0.90, "Preparing final results...")
             result = self._prepare_results(raw_data, matched_data, analytics_data)
-            if progress_callback:
-                progress_callback(0.95, "Finalizing data structures...")
+            progress_callback(0.95, "Finalizing data structures...")
             self._complete_pipeline_stage("finalization", True)
         except Exception as e:
             self._complete_pipeline_stage("finalization", False, str(e))
             return self._prepare_error_result(str(e))
 
-        self.state["overall_success"] = True
-        if progress_callback:
-            progress_callback(1.0, "Pipeline completed successfully!")
+        self.state.overall_success = True
+        progress_callback(1.0, "Pipeline completed successfully!")
         return result
 
     # =============================================================================
     # Pipeline Stages
     # =============================================================================
 
-    def _load_raw_data(
-        self, progress_callback: Callable[[float, str], None] | None = None
-    ) -> RawDataSources:
+    def _load_raw_data(self, progress_callback: Callable[[float, str], None]) -> RawDataSources:
         """Load raw data from all sources."""
-        race_key = self.config.get("race_key", "")
+        race_key = self.config.race_key
 
-        if progress_callback:
-            progress_callback(0.10, "Loading fantasy rider data...")
+        progress_callback(0.10, "Loading fantasy rider data...")
 
         # Get all raw data
         raw_data = get_all_raw_data(race_key)
 
-        if progress_callback:
-            progress_callback(0.15, "Loading race and startlist data...")
+        progress_callback(0.15, "Loading race and startlist data...")
 
         # Update state
-        self.state["total_fantasy_riders"] = len(raw_data.get("fantasy_riders", []))
+        self.state.total_fantasy_riders = len(raw_data.get("fantasy_riders", []))
 
-        if progress_callback:
-            progress_callback(0.20, "Loading cached PCS data...")
+        progress_callback(0.20, "Loading cached PCS data...")
 
         # Fetch missing PCS data if needed
-        if not self.config.get("use_cache", True) or self.config.get("force_refresh", False):
+        if not self.config.use_cache or self.config.force_refresh:
             startlist_riders = raw_data.get("startlist_riders", [])
-            rider_urls = [
-                rider.get("rider_url", "") for rider in startlist_riders if rider.get("rider_url")
-            ]
+            rider_urls = [url for url in (r.get("rider_url") for r in startlist_riders) if url]
 
             if rider_urls:
-                if progress_callback:
-                    progress_callback(0.25, f"Fetching PCS data for {len(rider_urls)} riders...")
-                new_pcs_data = fetch_missing_pcs_data(rider_urls, raw_data.get("pcs_cache"))
+                progress_callback(0.25, f"Fetching PCS data for {len(rider_urls)} riders...")
+                max_workers = self.config.batch_size if self.config.parallel_processing else 1
+
+                def fetch_progress(fraction: float, text: str) -> None:
+                    progress_callback(0.25 + 0.05 * fraction, text)
+
+                new_pcs_data = fetch_missing_pcs_data(
+                    rider_urls,
+                    raw_data.get("pcs_cache"),
+                    max_workers=max_workers,
+                    request_delay=self.config.api_delay,
+                    progress_callback=fetch_progress,
+                )
                 # Update cache in raw_data
                 pcs_cache = raw_data.get("pcs_cache", {})
                 pcs_cache.update(new_pcs_data)
                 raw_data["pcs_cache"] = pcs_cache
-                if progress_callback:
-                    progress_callback(0.30, "PCS data fetching completed")
+                progress_callback(0.30, "PCS data fetching completed")
 
-        if progress_callback:
-            progress_callback(0.32, "Raw data loading completed")
+        progress_callback(0.32, "Raw data loading completed")
 
         return raw_data
 
     def _match_riders(
         self,
         raw_data: RawDataSources,
-        progress_callback: Callable[[float, str], None] | None = None,
+        progress_callback: Callable[[float, str], None],
     ) -> MatchedDataSet:
         """Match riders across all data sources."""
-        fuzzy_threshold = self.config.get("fuzzy_threshold", 0.8)
+        fuzzy_threshold = self.config.fuzzy_threshold
 
-        if progress_callback:
-            progress_callback(0.40, "Initializing rider matching process...")
+        progress_callback(0.40, "Initializing rider matching process...")
 
         # Perform matching
         matches = match_all_data_sources(raw_data, fuzzy_threshold)
 
-        if progress_callback:
-            progress_callback(0.48, f"Matched {len(matches)} riders across data sources")
+        progress_callback(0.48, f"Matched {len(matches)} riders across data sources")
 
         # Update state
-        self.state["matched_riders_count"] = len(matches)
+        self.state.matched_riders_count = len(matches)
 
-        if progress_callback:
-            progress_callback(0.52, "Calculating match summary statistics...")
+        progress_callback(0.52, "Calculating match summary statistics...")
 
         # Calculate match summary
         match_summary = self._calculate_match_summary(raw_data, matches)
 
-        if progress_callback:
-            progress_callback(0.55, "Rider matching completed")
+        progress_callback(0.55, "Rider matching completed")
 
         return MatchedDataSet(
             riders=matches,
@@ -258,64 +253,57 @@ class DataPipeline:
         self,
         matched_data: MatchedDataSet,
         raw_data: RawDataSources,
-        progress_callback: Callable[[float, str], None] | None = None,
+        progress_callback: Callable[[float, str], None],
     ) -> AnalyticsDataSet:
         """Calculate analytics from matched data."""
         race_data = getattr(matched_data, "race_data", RaceData())
-        race_key = self.config.get("race_key", "")
-        use_enhanced = self.config.get("use_enhanced_analytics", True)
+        race_key = self.config.race_key
+        use_enhanced = self.config.use_enhanced_analytics
 
         matched_riders = matched_data.get("riders", {})
 
-        if progress_callback:
-            progress_callback(0.65, f"Computing basic rider metrics ({len(matched_riders)}...")
+        progress_callback(0.65, f"Computing basic rider metrics ({len(matched_riders)}...")
 
         # Calculate basic metrics for all riders
         basic_df = calculate_basic_rider_metrics(matched_riders)
 
-        if progress_callback:
-            progress_callback(0.70, f"Basic metrics calculated for {len(basic_df)} riders")
+        progress_callback(0.70, f"Basic metrics calculated for {len(basic_df)} riders")
 
         # Calculate enhanced metrics if requested
         enhanced_df = None
         if use_enhanced and race_data:
-            if progress_callback:
-                progress_callback(0.72, "Computing enhanced race analytics...")
+            progress_callback(0.72, "Computing enhanced race analytics...")
             try:
                 enhanced_df = calculate_enhanced_rider_analytics(
                     matched_riders, race_data, race_key
                 )
-                self.state["enhanced_analytics_count"] = len(enhanced_df)
-                if progress_callback:
-                    progress_callback(
-                        0.78, f"Enhanced analytics computed for {len(enhanced_df)} riders"
-                    )
+                self.state.enhanced_analytics_count = len(enhanced_df)
+                progress_callback(
+                    0.78, f"Enhanced analytics computed for {len(enhanced_df)} riders"
+                )
             except Exception as e:
                 logging.warning(f"Enhanced analytics failed: {e}")
-                enhanced_df = basic_df.copy()
-                if progress_callback:
-                    progress_callback(
-                        0.78, "Using basic metrics as fallback for enhanced analytics"
-                    )
+                # Downstream only reads the frame, so share it rather than copy
+                enhanced_df = basic_df
+                progress_callback(0.78, "Using basic metrics as fallback for enhanced analytics")
 
-        if progress_callback:
-            progress_callback(0.80, "Building individual rider analytics...")
+        progress_callback(0.80, "Building individual rider analytics...")
 
         # Create individual rider analytics
         rider_analytics = self._build_rider_analytics(
             matched_riders, basic_df, enhanced_df, use_enhanced
         )
 
-        if progress_callback:
-            progress_callback(0.83, "Computing race summary and pipeline metrics...")
+        progress_callback(0.83, "Computing race summary and pipeline metrics...")
 
-        # Define missing variables
-        race_summary = self._calculate_match_summary(raw_data, matched_riders)
+        # Define missing variables; the matching stage already summarized these riders
+        race_summary = matched_data.get("match_summary") or self._calculate_match_summary(
+            raw_data, matched_riders
+        )
         computed_race_info = {}  # Placeholder for computed race info
         pipeline_info = self._get_performance_metrics()
 
-        if progress_callback:
-            progress_callback(0.85, "Analytics computation completed")
+        progress_callback(0.85, "Analytics computation completed")
 
         return AnalyticsDataSet(
             riders=rider_analytics,
@@ -344,26 +332,25 @@ class DataPipeline:
         summary = {
             "total_riders": len(raw_data.get("fantasy_riders", [])),
             "matched_riders": matched_data.get("match_summary", {}).get("matched_riders", 0),
-            "enhanced_analytics": self.state.get("enhanced_analytics_count", 0),
+            "enhanced_analytics": self.state.enhanced_analytics_count,
             "data_sources": {
                 "fantasy": bool(raw_data.get("fantasy_riders")),
                 "startlist": bool(raw_data.get("startlist_riders")),
                 "pcs_cache": bool(raw_data.get("pcs_cache")),
                 "race_data": bool(raw_data.get("race_data")),
             },
-            "pipeline_stages": len(self.state.get("stages", [])),
-            "overall_success": self.state.get("overall_success", False),
+            "pipeline_stages": len(self.state.pipeline_stages),
+            "overall_success": self.state.overall_success,
         }
 
         # Collect errors
         errors = []
 
-        for stage in self.state.get("stages", []):
-            stage_name = stage.get("stage_name", "Unknown Stage")
-            stage_status = "Success" if stage.get("success", True) else "Failed"
-            if not stage.get("success", True):
-                error_message = stage.get("error_message", "No error message")
-                errors.append(f"{stage_name}: {stage_status} - {error_message}")
+        for stage in self.state.pipeline_stages:
+            # The stage being finalized hasn't completed yet, so only recorded failures count
+            if stage.end_time_perf is not None and not stage.success:
+                error_message = stage.error_message or "No error message"
+                errors.append(f"{stage.stage_name}: Failed - {error_message}")
 
         return DataLoadResult(
             riders_df=main_df,
@@ -378,15 +365,15 @@ class DataPipeline:
 
     def _prepare_error_result(self, error_message: str) -> DataLoadResult:
         """Prepare error result when pipeline fails."""
-        raw_data = self.state.get("raw_data")
+        raw_data = self.state.raw_data
         if raw_data is None:
             raw_data = RawDataSources()
 
-        matched_data = self.state.get("matched_data")
+        matched_data = self.state.matched_data
         if matched_data is None:
             matched_data = MatchedDataSet()
 
-        analytics_data = self.state.get("analytics_data")
+        analytics_data = self.state.analytics_data
         if analytics_data is None:
             analytics_data = AnalyticsDataSet()
 
@@ -407,41 +394,36 @@ class DataPipeline:
 
     def _start_pipeline_stage(self, stage_name: str) -> None:
         """Start tracking a pipeline stage."""
-        self.state["current_stage"] = stage_name
+        self.state.current_stage = stage_name
 
         stage = PipelineStage(
             stage_name=stage_name,
             start_time=datetime.now().isoformat(),
-            success=False,
-            items_processed=0,
-            items_succeeded=0,
+            start_time_perf=time.perf_counter(),
         )
 
-        if "pipeline_stages" not in self.state:
-            self.state["pipeline_stages"] = []
-        self.state["pipeline_stages"].append(stage)
+        self.state.pipeline_stages.append(stage)
+        self._stages_by_name[stage_name] = stage
 
-        if self.config.get("verbose_logging", True):
+        if self.config.verbose_logging:
             logging.info(f"🔄 Starting pipeline stage: {stage_name}")
 
     def _complete_pipeline_stage(
         self, search_stage_name: str, success: bool, error_message: str | None = None
     ) -> None:
         """Complete tracking a pipeline stage."""
-        self.state["current_stage"] = None
+        self.state.current_stage = None
 
         # Find and update the stage
-        pipeline_stages = self.state.get("pipeline_stages", [])
-        for stage in reversed(pipeline_stages):
-            stage_name = stage.get("stage_name", "")
-            if stage_name == search_stage_name:
-                stage["end_time"] = datetime.now().isoformat()
-                stage["success"] = success
-                if error_message:
-                    stage["error_message"] = error_message
-                break
-
-        if self.config.get("verbose_logging", True):
+        stage = self._stages_by_name.get(search_stage_name)
+        if stage is not None:
+            stage.end_time = datetime.now().isoformat()
+            stage.end_time_perf = time.perf_counter()
+            stage.success = success
+            if error_message:
+                stage.error_message = error_message
+
+        if self.config.verbose_logging:
             status = "✅" if success else "❌"
             logging.info(f"{status} Completed pipeline stage: {search_stage_name}")
             if error_message:
@@ -465,31 +447,22 @@ class DataPipeline:
         # Match confidence
         race_match = match_info.get("race_match")
         if race_match:
-            confidence = race_match.get("match_confidence", 0.0)
-            score += 0.2 * confidence
+            score += 0.2 * race_match.match_confidence
 
         return min(1.0, score)
 
     def _get_performance_metrics(self) -> dict[str, Any]:
         """Get pipeline performance metrics."""
-        pipeline_stages = self.state.get("pipeline_stages", [])
+        pipeline_stages = self.state.pipeline_stages
         total_time = 0.0
         stage_times = {}
         for stage in pipeline_stages:
-            start_time = stage.get("start_time")
-            end_time = stage.get("end_time")
-            if start_time and end_time:
-                try:
-                    start = datetime.fromisoformat(start_time)
-                    end = datetime.fromisoformat(end_time)
-                    duration = (end - start).total_seconds()
-                    if duration < 0:
-                        duration = 0.0
-                    stage_times[stage.get("stage_name")] = duration
-                    total_time += duration
-                except Exception:
-                    continue
-        successful_stages = sum(1 for s in pipeline_stages if s.get("success"))
+            # Monotonic readings, so no parsing and no negative durations from clock changes
+            if stage.end_time_perf is not None:
+                duration = stage.end_time_perf - stage.start_time_perf
+                stage_times[stage.stage_name] = duration
+                total_time += duration
+        successful_stages = sum(1 for stage in pipeline_stages if stage.success)
         return {
             "total_time_seconds": total_time,
             "stage_times": stage_times,
@@ -498,33 +471,54 @@ class DataPipeline:
         }
 
     def _calculate_match_summary(self, raw_data, matches):
+        total_fantasy_riders = len(raw_data.get("fantasy_riders", []))
+
+        # Count both data flags in a single pass over the matches
+        has_pcs_data = has_race_data = 0
+        for match in matches.values():
+            if match.get("has_pcs_data", False):
+                has_pcs_data += 1
+            if match.get("has_race_data", False):
+                has_race_data += 1
+
         return {
-            "total_fantasy_riders": len(raw_data.get("fantasy_riders", [])),
+            "total_fantasy_riders": total_fantasy_riders,
             "matched_riders": len(matches),
-            "has_pcs_data": sum(1 for m in matches.values() if m.get("has_pcs_data", False)),
-            "has_race_data": sum(1 for m in matches.values() if m.get("has_race_data", False)),
-            "match_rate": len(matches) / max(1, len(raw_data.get("fantasy_riders", []))),
+            "has_pcs_data": has_pcs_data,
+            "has_race_data": has_race_data,
+            "match_rate": len(matches) / max(1, total_fantasy_riders),
         }
 
     def _build_rider_analytics(self, matched_riders, basic_df, enhanced_df, use_enhanced):
+        # Convert each metrics frame to row dicts once, instead of a .loc lookup per rider
+        basic_rows = self._rows_by_fantasy_name(basic_df)
+        enhanced_rows = (
+            self._rows_by_fantasy_name(enhanced_df)
+            if use_enhanced and enhanced_df is not None
+            else {}
+        )
+
         rider_analytics = {}
         for fantasy_name, match_info in matched_riders.items():
             rider_data = RiderAnalyticsData(
                 fantasy_name=fantasy_name,
                 canonical_name=match_info.get("canonical_name", ""),
                 match_info=match_info,
-                basic_metrics=basic_df.loc[fantasy_name].to_dict()
-                if fantasy_name in basic_df.index
-                else {},
-                race_analytics=enhanced_df.loc[fantasy_name].to_dict()
-                if use_enhanced and enhanced_df is not None and fantasy_name in enhanced_df.index
-                else None,
+                basic_metrics=basic_rows.get(fantasy_name, {}),
+                race_analytics=enhanced_rows.get(fantasy_name),
                 has_enhanced_analytics=use_enhanced and bool(enhanced_df is not None),
                 data_quality_score=self._calculate_data_quality(match_info),
             )
             rider_analytics[fantasy_name] = rider_data
         return rider_analytics
 
+    @staticmethod
+    def _rows_by_fantasy_name(metrics_df: pd.DataFrame) -> dict[str, dict[str, Any]]:
+        """Map each fantasy name in a metrics DataFrame to its row as a dict."""
+        if "fantasy_name" not in metrics_df.columns:
+            return {}
+        return {row["fantasy_name"]: row for row in metrics_df.to_dict("records")}
+
 
 # =============================================================================
 # Convenience Functions
@@ -549,9 +543,9 @@ def run_pipeline(
     """
     if config is None:
         config = create_default_config(race_key)
-    else:
+    elif config.race_key != race_key:
         # Ensure race_key is set
-        config["race_key"] = race_key
+        config = replace(config, race_key=race_key)
 
     pipeline = DataPipeline(config)
     return pipeline.run(progress_callback)
@@ -574,6 +568,6 @@ def get_pipeline_summary(race_key: str) -> dict[str, Any]:
         "stages": ["loading", "matching", "analytics", "finalization"],
         "data_sources": ["fantasy_riders", "startlist_riders", "pcs_cache", "race_data"],
         "analytics_types": ["basic_metrics", "enhanced_metrics", "race_summary"],
-        "configuration": config,
+        "configuration": asdict(config),
         "estimated_time_seconds": 30,  # Rough estimate
     }
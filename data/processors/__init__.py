@@ -2,13 +2,7 @@
 Data processors for transforming and analyzing data.
 """
 
-from .rider_matching import (
-    match_fantasy_to_pcs,
-    match_fantasy_to_race_data,
-    match_riders_across_sources,
-    # Legacy compatibility
-    match_rider_names,
-)
+from ..matching import match_fantasy_to_race_data
 from .race_analytics import (
     calculate_climb_stats,
     calculate_stage_stats,
@@ -28,9 +22,5 @@ __all__ = [
     "calculate_stage_stats",
     "calculate_climb_stats",
     # Unified matching functions
-    "match_fantasy_to_pcs",
     "match_fantasy_to_race_data",
-    "match_riders_across_sources",
-    # Legacy compatibility
-    "match_rider_names",
 ]
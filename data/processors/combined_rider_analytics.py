@@ -5,10 +5,18 @@ Combines rider season results with detailed race stage data to provide
 comprehensive analytics with stage-by-stage and classification-specific insights.
 """
 
+import math
 import statistics
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any
 
-import numpy as np
-
+from ..analytics import parse_distance_km
+from ..matching import (
+    extract_rider_from_classifications,
+    match_fantasy_to_race_data,
+    normalize_rider_name,
+)
 from ..models.combined_analytics import (
     ClassificationAnalytics,
     RaceAnalyticsSummary,
@@ -17,15 +25,18 @@ from ..models.combined_analytics import (
 )
 from ..models.race import RaceData, StageData
 from ..models.rider import RiderData
-from .rider_matching import (
-    extract_rider_from_classifications,
-    match_fantasy_to_race_data,
-    normalize_rider_name,
-)
 
+# Stage profile icon -> terrain slot used by classify_rider_type (flat, hilly, mountain)
+_TERRAIN_BUCKETS = {"p1": 0, "p2": 1, "p3": 1, "p4": 2, "p5": 2}
 
+
+@lru_cache(maxsize=4096)
 def parse_time_to_seconds(time_str: str | None) -> float | None:
-    """Parse time string (HH:MM:SS or MM:SS) to seconds."""
+    """
+    Parse time string (HH:MM:SS or MM:SS) to seconds.
+
+    Cached: the winner's and leader's times are shared by every rider on a stage.
+    """
     if not time_str or time_str == "0:00:00":
         return 0.0
 
@@ -57,8 +68,17 @@ def calculate_time_gap(rider_time: str | None, reference_time: str | None) -> fl
     return rider_seconds - reference_seconds
 
 
+def _format_time_gap(gap_seconds: float | None) -> str | None:
+    """Format a time gap in seconds as [-]M:SS; None for no gap or a zero gap."""
+    if not gap_seconds:
+        return None
+    sign = "-" if gap_seconds < 0 else ""
+    minutes, seconds = divmod(int(abs(gap_seconds)), 60)
+    return f"{sign}{minutes}:{seconds:02d}"
+
+
 def extract_stage_performance(
-    rider_name: str,
+    classifications: dict[str, Any],
     stage_data: StageData,
     stage_number: int,
     winner_time: str | None = None,
@@ -68,7 +88,7 @@ def extract_stage_performance(
     Extract comprehensive stage performance for a specific rider.
 
     Args:
-        rider_name: Canonical rider name to search for
+        classifications: The rider's rows in this stage, from extract_rider_from_classifications
         stage_data: Complete stage data
         stage_number: Stage number (1-indexed)
         winner_time: Stage winner's time for gap calculation
@@ -77,9 +97,6 @@ def extract_stage_performance(
     Returns:
         StagePerformance or None if rider not found
     """
-    # Get rider data from all classifications
-    classifications = extract_rider_from_classifications(rider_name, stage_data)
-
     if not classifications:
         return None
 
@@ -122,16 +139,8 @@ def extract_stage_performance(
         # Stage results
         stage_rank=stage_result.get("rank"),
         time=rider_time,
-        time_behind_winner=(
-            f"{time_gap_to_winner / 60:.0f}:{time_gap_to_winner % 60:02.0f}"
-            if time_gap_to_winner
-            else None
-        ),
-        time_behind_leader=(
-            f"{time_gap_to_leader / 60:.0f}:{time_gap_to_leader % 60:02.0f}"
-            if time_gap_to_leader
-            else None
-        ),
+        time_behind_winner=_format_time_gap(time_gap_to_winner),
+        time_behind_leader=_format_time_gap(time_gap_to_leader),
         bonus_time=stage_result.get("bonus"),
         status=stage_result.get("status"),
         # Classification positions
@@ -151,15 +160,25 @@ def extract_stage_performance(
     )
 
 
+def _mean(values: list[float]) -> float:
+    """Arithmetic mean; plain float math instead of statistics.mean's exact fractions."""
+    return sum(values) / len(values)
+
+
+def _stdev(values: list[float]) -> float:
+    """Sample standard deviation (n - 1), two-pass like statistics.stdev."""
+    mean = _mean(values)
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
 def calculate_classification_analytics(
-    rider_name: str, stages: list[StageData], classification_type: str
+    stage_classifications: list[dict[str, Any]], classification_type: str
 ) -> ClassificationAnalytics | None:
     """
     Calculate analytics for a specific classification.
 
     Args:
-        rider_name: Canonical rider name
-        stages: List of completed stages
+        stage_classifications: The rider's classification rows for each completed stage
         classification_type: 'gc', 'points', 'kom', 'youth', 'team'
 
     Returns:
@@ -168,8 +187,7 @@ def calculate_classification_analytics(
     ranks = []
     points_earned = 0
 
-    for stage in stages:
-        classifications = extract_rider_from_classifications(rider_name, stage)
+    for classifications in stage_classifications:
         classification_data = classifications.get(classification_type, {}).get("data", {})
 
         if classification_data:
@@ -184,15 +202,18 @@ def calculate_classification_analytics(
     if not ranks:
         return None
 
-    current_rank = ranks[-1] if ranks else None
-    best_rank = min(ranks) if ranks else None
-    worst_rank = max(ranks) if ranks else None
+    # One sorted copy gives best/worst rank and both top-N counts; ranks keeps stage order
+    sorted_ranks = sorted(ranks)
+
+    current_rank = ranks[-1]
+    best_rank = sorted_ranks[0]
+    worst_rank = sorted_ranks[-1]
 
     # Calculate additional metrics
-    stages_in_top_10 = sum(1 for rank in ranks if rank <= 10)
-    stages_in_top_5 = sum(1 for rank in ranks if rank <= 5)
-    average_rank = statistics.mean(ranks) if ranks else None
-    rank_volatility = statistics.stdev(ranks) if len(ranks) > 1 else 0.0
+    stages_in_top_10 = bisect_right(sorted_ranks, 10)
+    stages_in_top_5 = bisect_right(sorted_ranks, 5)
+    average_rank = _mean(ranks)
+    rank_volatility = _stdev(ranks) if len(ranks) > 1 else 0.0
 
     return ClassificationAnalytics(
         current_rank=current_rank,
@@ -207,6 +228,21 @@ def calculate_classification_analytics(
     )
 
 
+def _linreg_slope(y: list[float]) -> float:
+    """
+    Least-squares slope of ``y`` against its index (0, 1, ..., n-1).
+
+    Closed form of ``np.polyfit(range(n), y, 1)[0]``; the x sums are known
+    analytically, so only one pass over ``y`` is needed.
+    """
+    n = len(y)
+    sx = n * (n - 1) / 2
+    sxx = (n - 1) * n * (2 * n - 1) / 6
+    sy = sum(y)
+    sxy = sum(i * v for i, v in enumerate(y))
+    return (n * sxy - sx * sy) / (n * sxx - sx * sx)
+
+
 def calculate_trend_metrics(
     stage_performances: list[StagePerformance],
 ) -> dict[str, float | None]:
@@ -237,33 +273,30 @@ def calculate_trend_metrics(
     # Calculate linear trends (negative slope = improvement)
     stage_position_trend = None
     if len(stage_positions) >= 2:
-        x = list(range(len(stage_positions)))
-        stage_position_trend = np.polyfit(x, stage_positions, 1)[0] if stage_positions else None
+        stage_position_trend = _linreg_slope(stage_positions)
 
     gc_position_trend = None
     if len(gc_positions) >= 2:
-        x = list(range(len(gc_positions)))
-        gc_position_trend = np.polyfit(x, gc_positions, 1)[0] if gc_positions else None
+        gc_position_trend = _linreg_slope(gc_positions)
 
     time_gap_trend = None
     if len(time_gaps) >= 2:
-        x = list(range(len(time_gaps)))
-        time_gap_trend = np.polyfit(x, time_gaps, 1)[0] if time_gaps else None
+        time_gap_trend = _linreg_slope(time_gaps)
 
     # Consistency score (coefficient of variation)
     consistency_score = None
     if len(stage_positions) >= 2:
-        mean_pos = statistics.mean(stage_positions)
+        mean_pos = _mean(stage_positions)
         if mean_pos > 0:
-            std_pos = statistics.stdev(stage_positions)
+            std_pos = _stdev(stage_positions)
             consistency_score = std_pos / mean_pos
 
     # Improvement score (comparing first half vs second half)
     improvement_score = None
     if len(stage_positions) >= 4:
         half_point = len(stage_positions) // 2
-        first_half_avg = statistics.mean(stage_positions[:half_point])
-        second_half_avg = statistics.mean(stage_positions[half_point:])
+        first_half_avg = _mean(stage_positions[:half_point])
+        second_half_avg = _mean(stage_positions[half_point:])
         # Negative score = improvement (lower positions)
         improvement_score = second_half_avg - first_half_avg
 
@@ -286,36 +319,31 @@ def classify_rider_type(stage_performances: list[StagePerformance]) -> str | Non
     if not stage_performances:
         return None
 
-    # Analyze performance by stage type
-    flat_stages = []
-    hilly_stages = []
-    mountain_stages = []
+    # Analyze performance by stage type: rank sums and counts per terrain slot
+    rank_sums = [0, 0, 0]
+    rank_counts = [0, 0, 0]
 
     for perf in stage_performances:
-        profile = perf.get("profile_icon", "")
+        bucket = _TERRAIN_BUCKETS.get(perf.get("profile_icon", ""))
         stage_rank = perf.get("stage_rank")
 
-        if not stage_rank:
+        if bucket is None or not stage_rank:
             continue
 
-        if profile in ["p1"]:  # Flat
-            flat_stages.append(stage_rank)
-        elif profile in ["p2", "p3"]:  # Hilly
-            hilly_stages.append(stage_rank)
-        elif profile in ["p4", "p5"]:  # Mountain
-            mountain_stages.append(stage_rank)
+        rank_sums[bucket] += stage_rank
+        rank_counts[bucket] += 1
 
     # Calculate average positions by terrain
-    avg_flat = statistics.mean(flat_stages) if flat_stages else float("inf")
-    avg_hilly = statistics.mean(hilly_stages) if hilly_stages else float("inf")
-    avg_mountain = statistics.mean(mountain_stages) if mountain_stages else float("inf")
+    avg_flat, avg_hilly, avg_mountain = (
+        rank_sums[i] / rank_counts[i] if rank_counts[i] else math.inf for i in range(3)
+    )
 
     # Simple classification logic
     if avg_flat <= 10 and avg_flat < avg_mountain and avg_flat < avg_hilly:
         return "sprinter"
     elif avg_mountain <= 10 and avg_mountain < avg_flat and avg_mountain < avg_hilly:
         return "climber"
-    elif all(avg <= 15 for avg in [avg_flat, avg_hilly, avg_mountain] if avg != float("inf")):
+    elif all(avg <= 15 for avg in [avg_flat, avg_hilly, avg_mountain] if avg != math.inf):
         return "all_rounder"
     elif min(avg_flat, avg_hilly, avg_mountain) <= 20:
         return "gc_contender"
@@ -345,9 +373,17 @@ def calculate_race_specific_analytics(
     stages = race_data.get("stages", [])
     completed_stages = [stage for stage in stages if stage.get("results")]
 
+    # Find the rider in each stage's classifications once; the stage performance and all
+    # four classification analytics below read from these rows
+    stage_classifications = [
+        extract_rider_from_classifications(canonical_name, stage) for stage in completed_stages
+    ]
+
     # Extract stage performances
     stage_results = []
-    for i, stage in enumerate(completed_stages, 1):
+    for i, (stage, classifications) in enumerate(
+        zip(completed_stages, stage_classifications, strict=True), 1
+    ):
         # Get winner time for gap calculations
         stage_results_data = stage.get("results", [])
         winner_time = stage_results_data[0].get("time") if stage_results_data else None
@@ -356,34 +392,47 @@ def calculate_race_specific_analytics(
         gc_data = stage.get("general_classification", [])
         leader_time = gc_data[0].get("time") if gc_data else None
 
-        stage_perf = extract_stage_performance(canonical_name, stage, i, winner_time, leader_time)
+        stage_perf = extract_stage_performance(classifications, stage, i, winner_time, leader_time)
 
         if stage_perf:
             stage_results.append(stage_perf)
 
-    # Calculate aggregated statistics
-    stage_ranks = [p.get("stage_rank") for p in stage_results if p.get("stage_rank")]
-
-    avg_stage_position = statistics.mean(stage_ranks) if stage_ranks else None
+    # Calculate aggregated statistics, point totals and field percentile in one pass
+    stage_ranks = []
+    top_10_finishes = top_5_finishes = stage_wins = 0
+    total_stage_pcs = total_stage_uci = 0
+    percentile_sum = 0.0
+    percentile_count = 0
+
+    for perf in stage_results:
+        rank = perf.get("stage_rank")
+        if rank:
+            stage_ranks.append(rank)
+            if rank <= 10:
+                top_10_finishes += 1
+                if rank <= 5:
+                    top_5_finishes += 1
+                    if rank == 1:
+                        stage_wins += 1
+
+        total_stage_pcs += perf.get("stage_pcs_points", 0)
+        total_stage_uci += perf.get("stage_uci_points", 0)
+
+        percentile = perf.get("percentile_finish")
+        if percentile:
+            percentile_sum += percentile
+            percentile_count += 1
+
+    avg_stage_position = sum(stage_ranks) / len(stage_ranks) if stage_ranks else None
     median_stage_position = statistics.median(stage_ranks) if stage_ranks else None
     best_stage_position = min(stage_ranks) if stage_ranks else None
     worst_stage_position = max(stage_ranks) if stage_ranks else None
 
-    top_10_finishes = sum(1 for rank in stage_ranks if rank <= 10)
-    top_5_finishes = sum(1 for rank in stage_ranks if rank <= 5)
-    stage_wins = sum(1 for rank in stage_ranks if rank == 1)
-
     # Calculate classification analytics
-    gc_analytics = calculate_classification_analytics(canonical_name, completed_stages, "gc")
-    points_analytics = calculate_classification_analytics(
-        canonical_name, completed_stages, "points"
-    )
-    kom_analytics = calculate_classification_analytics(canonical_name, completed_stages, "kom")
-    youth_analytics = calculate_classification_analytics(canonical_name, completed_stages, "youth")
-
-    # Calculate point totals
-    total_stage_pcs = sum(p.get("stage_pcs_points", 0) for p in stage_results)
-    total_stage_uci = sum(p.get("stage_uci_points", 0) for p in stage_results)
+    gc_analytics = calculate_classification_analytics(stage_classifications, "gc")
+    points_analytics = calculate_classification_analytics(stage_classifications, "points")
+    kom_analytics = calculate_classification_analytics(stage_classifications, "kom")
+    youth_analytics = calculate_classification_analytics(stage_classifications, "youth")
 
     # Calculate trends and performance metrics
     trends = calculate_trend_metrics(stage_results)
@@ -392,16 +441,16 @@ def calculate_race_specific_analytics(
     best_classification = None
     best_rank = float("inf")
 
-    for classification, analytics in [
+    for classification, analytics in (
         ("gc", gc_analytics),
         ("points", points_analytics),
         ("kom", kom_analytics),
         ("youth", youth_analytics),
-    ]:
-        if analytics and analytics.get("best_rank"):
-            if analytics["best_rank"] < best_rank:
-                best_rank = analytics["best_rank"]
-                best_classification = classification
+    ):
+        rank = analytics.get("best_rank") if analytics else None
+        if rank and rank < best_rank:
+            best_rank = rank
+            best_classification = classification
 
     # Calculate fantasy metrics
     stars = rider.get("stars", 0)
@@ -416,11 +465,7 @@ def calculate_race_specific_analytics(
     if has_stage_data:
         completeness += 0.7
 
-    # Calculate field position percentile
-    field_percentiles = [
-        p.get("percentile_finish") for p in stage_results if p.get("percentile_finish")
-    ]
-    field_position_percentile = statistics.mean(field_percentiles) if field_percentiles else None
+    field_position_percentile = percentile_sum / percentile_count if percentile_count else None
 
     return RiderRaceAnalytics(
         # Identification
@@ -490,20 +535,12 @@ def calculate_race_analytics_summary(race_data: RaceData, race_key: str) -> Race
 
         # Collect all riders
         results = stage.get("results", [])
-        for result in results:
-            rider_name = result.get("rider_name")
-            if rider_name:
-                total_riders.add(rider_name)
+        total_riders.update(filter(None, (result.get("rider_name") for result in results)))
 
         # Sum distance (if available and numeric)
-        distance_str = stage.get("distance", "")
-        if distance_str:
-            try:
-                # Extract numeric part (e.g., "150.5 km" -> 150.5)
-                distance_num = float(distance_str.split()[0])
-                total_distance += distance_num
-            except (ValueError, IndexError):
-                pass
+        distance_num = parse_distance_km(stage.get("distance"))
+        if distance_num is not None:
+            total_distance += distance_num
 
     # Get current leaders
     current_leaders = {}
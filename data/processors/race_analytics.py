@@ -2,22 +2,21 @@
 Race data processing and analytics calculations.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from data.models.race import ComputedRaceInfo, RaceData, StageData
 
 
-def _is_stage_completed(stage: StageData) -> bool:
+def _is_stage_completed(stage: StageData, today: date) -> bool:
     """Check if a stage has been completed based on available data."""
     # Determine if stage is completed
     is_completed = False
 
-    today = datetime.now().date()
     stage_date = stage.get("date")
     try:
         # Assuming date format is "MM-DD" for 2025
-        stage_date_obj = datetime.strptime(f"2025-{stage_date}", "%Y-%m-%d").date()
+        stage_date_obj = date.fromisoformat(f"2025-{stage_date}")
         is_completed = stage_date_obj <= today
     except ValueError:
         # Check for alternative completion indicators
@@ -30,80 +29,109 @@ def _is_stage_completed(stage: StageData) -> bool:
     return is_completed
 
 
-def calculate_stage_stats(stages: list[StageData]) -> dict[str, Any]:
-    """Calculate statistics about stages."""
+def _stage_completion(stages: list[StageData]) -> list[bool]:
+    """Completion flag for each stage, judged against a single reading of today's date."""
+    today = datetime.now().date()
+    return [_is_stage_completed(stage, today) for stage in stages]
+
+
+def calculate_stage_stats(
+    stages: list[StageData], completion: list[bool] | None = None
+) -> dict[str, Any]:
+    """
+    Calculate statistics about stages.
+
+    Args:
+        stages: Stages of the race
+        completion: Per-stage completion flags; computed from the stage dates if omitted
+
+    Returns:
+        Dictionary of distance, vertical and completion statistics
+    """
     if not stages:
         return {}
 
+    if completion is None:
+        completion = _stage_completion(stages)
+
     distances = []
     vertical_meters = []
-    completed_stages = []
-    incomplete_stages = []
+    completed_count = 0
+    incomplete_count = 0
+    completed_distance = 0.0
+    incomplete_distance = 0.0
+    shortest_stage = None
+    longest_stage = None
+    shortest_distance = float("inf")
+    longest_distance = float("-inf")
+
+    # Fold every statistic into a single pass over the stages
+    for stage, is_completed in zip(stages, completion, strict=True):
+        distance = stage.get("distance")
 
-    for stage in stages:
-        # Parse distance
-        if stage.get("distance") is not None:
-            distances.append(stage.get("distance"))
+        # Parse distance, tracking the shortest and longest stage as we go
+        if distance is not None:
+            if distance < shortest_distance:
+                shortest_stage, shortest_distance = stage, distance
+            if distance > longest_distance:
+                longest_stage, longest_distance = stage, distance
+            distances.append(distance)
 
         # Parse vertical meters
         if stage.get("vertical_meters") is not None:
             vertical_meters.append(stage.get("vertical_meters"))
 
         # Check completion status
-        if _is_stage_completed(stage):
-            completed_stages.append(stage)
+        if is_completed:
+            completed_count += 1
+            completed_distance += stage.get("distance", 0.0)
         else:
-            incomplete_stages.append(stage)
+            incomplete_count += 1
+            incomplete_distance += stage.get("distance", 0.0)
 
-    # Find shortest and longest stages
-    shortest_stage = None
-    longest_stage = None
-    if distances and stages:
-        stages_with_distances = [
-            (stage, stage.get("distance"))
-            for stage in stages
-            if stage.get("distance") is not None
-        ]
-
-        if stages_with_distances:
-            shortest_stage = min(stages_with_distances, key=lambda x: x[1])[0]
-            longest_stage = max(stages_with_distances, key=lambda x: x[1])[0]
+    total_distance = sum(distances)
 
     return {
-        "total_distance": sum(distances) if distances else None,
-        "avg_distance": sum(distances) / len(distances) if distances else None,
+        "total_distance": total_distance if distances else None,
+        "avg_distance": total_distance / len(distances) if distances else None,
         "avg_vertical_meters": (
             sum(vertical_meters) / len(vertical_meters) if vertical_meters else None
         ),
         "shortest_stage": shortest_stage,
         "longest_stage": longest_stage,
-        "completed_count": len(completed_stages),
-        "incomplete_count": len(incomplete_stages),
-        "completed_distance": (
-            sum(stage.get("distance", 0.0) for stage in completed_stages)
-            if completed_stages
-            else None
-        ),
-        "incomplete_distance": (
-            sum(stage.get("distance", 0.0) for stage in incomplete_stages)
-            if incomplete_stages
-            else None
-        ),
+        "completed_count": completed_count,
+        "incomplete_count": incomplete_count,
+        "completed_distance": completed_distance if completed_count else None,
+        "incomplete_distance": incomplete_distance if incomplete_count else None,
     }
 
 
-def calculate_climb_stats(stages: list[StageData]) -> dict[str, Any]:
-    """Calculate statistics about climbs across all stages."""
+def calculate_climb_stats(
+    stages: list[StageData], completion: list[bool] | None = None
+) -> dict[str, Any]:
+    """
+    Calculate statistics about climbs across all stages.
+
+    Args:
+        stages: Stages of the race
+        completion: Per-stage completion flags; computed from the stage dates if omitted
+
+    Returns:
+        Dictionary of total, completed and incomplete climb counts
+    """
+    if completion is None:
+        completion = _stage_completion(stages)
+
     total_climbs = 0
     completed_climbs = 0
     incomplete_climbs = 0
 
-    for stage in stages:
+    for stage, is_completed in zip(stages, completion, strict=True):
         stage_climbs = stage.get("climbs", [])
         stage_climb_count = len(stage_climbs)
         total_climbs += stage_climb_count
 
-        if _is_stage_completed(stage):
+        if is_completed:
             completed_climbs += stage_climb_count
         else:
             incomplete_climbs += stage_climb_count
@@ -130,11 +158,14 @@ def prepare_race_data(race_data: RaceData) -> RaceData:
     """
     stages = race_data.get("stages", [])
 
+    # Decide each stage's completion once; both stat helpers split on it
+    completion = _stage_completion(stages)
+
     # Calculate stage statistics
-    stage_stats = calculate_stage_stats(stages)
+    stage_stats = calculate_stage_stats(stages, completion)
 
     # Calculate climb statistics
-    climb_stats = calculate_climb_stats(stages)
+    climb_stats = calculate_climb_stats(stages, completion)
 
     # Build computed race info
     computed_info: ComputedRaceInfo = {}
@@ -7,23 +7,38 @@ from datetime import datetime
 
 from procyclingstats import RaceStartlist, Rider
 
-from config.settings import PCS_CACHE_FILE, SUPPORTED_RACES
-from utils.cache_manager import load_cache, refresh_cache, save_cache
+from config.settings import LEGACY_PCS_CACHE_FILE, PCS_CACHE_FILE, SUPPORTED_RACES
+from utils.cache_manager import (
+    import_json_cache,
+    load_cache,
+    load_entry_cache,
+    load_entry_cache_keys,
+    refresh_cache,
+    save_cache,
+    save_cache_entry,
+)
 from utils.url_patterns import startlist_path
 
 
 def load_pcs_cache():
-    """Load PCS data from cache file if it exists and is not expired."""
-    return load_cache(PCS_CACHE_FILE, "riders_data")
+    """Load unexpired PCS rider data from the cache database."""
+    import_json_cache(LEGACY_PCS_CACHE_FILE, PCS_CACHE_FILE, "riders_data")
+    return load_entry_cache(PCS_CACHE_FILE)
 
 
-def save_pcs_cache(riders_data):
-    """Save PCS data to cache file with timestamp."""
-    save_cache(PCS_CACHE_FILE, riders_data, "riders_data")
+def load_pcs_cache_keys():
+    """Load the rider URLs with unexpired PCS data in the cache database."""
+    import_json_cache(LEGACY_PCS_CACHE_FILE, PCS_CACHE_FILE, "riders_data")
+    return load_entry_cache_keys(PCS_CACHE_FILE)
+
+
+def save_pcs_cache_entry(rider_url, pcs_data):
+    """Save PCS data for a single rider to the cache database."""
+    save_cache_entry(PCS_CACHE_FILE, rider_url, pcs_data)
 
 
 def refresh_pcs_cache():
-    """Force refresh of PCS cache by deleting the cache file."""
+    """Force refresh of PCS cache by emptying the cache database (the file is kept)."""
     refresh_cache(PCS_CACHE_FILE, "PCS")
 
 
@@ -46,7 +61,7 @@ def save_startlist_cache(race_name, startlist_data):
 
 
 def refresh_startlist_cache(race_name="TDF_FEMMES_2025"):
-    """Force refresh of PCS startlist cache by deleting the cache file."""
+    """Force refresh of PCS startlist cache by deleting its JSON cache file."""
     if race_name not in SUPPORTED_RACES:
         # Throw error?
         return
@@ -87,13 +102,14 @@ def fetch_startlist_data(race_name="TDF_FEMMES_2025"):
     return startlist_riders
 
 
-def fetch_rider_pcs_data(rider_url, rider_name):
+def fetch_rider_pcs_data(rider_url, rider_name, fetched_at=None):
     """
     Fetch PCS data for a single rider.
 
     Args:
         rider_url: PCS URL for the rider
         rider_name: Display name for logging
+        fetched_at: Timestamp for the error dict, shared across a batch (defaults to now)
 
     Returns:
         dict: PCS data for the rider, or error dict if fetch fails
@@ -108,5 +124,5 @@ def fetch_rider_pcs_data(rider_url, rider_name):
         logging.error(f"❌ Error fetching data for {rider_name} ({rider_url}): {e}")
         return {
             "error": str(e),
-            "fetched_at": datetime.now().isoformat(),
+            "fetched_at": fetched_at or datetime.now().isoformat(),
         }
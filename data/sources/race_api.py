@@ -8,24 +8,39 @@ from typing import Any
 
 from procyclingstats import Race, RaceClimbs, Stage
 
-from config.settings import RACE_CACHE_FILE, SUPPORTED_RACES
+from config.settings import LEGACY_RACE_CACHE_FILE, RACE_CACHE_FILE, SUPPORTED_RACES
 from data.models.race import RaceData, StageData
-from utils.cache_manager import load_cache, refresh_cache, save_cache
+from utils.cache_manager import (
+    import_json_cache,
+    is_error_payload,
+    load_cache_entry,
+    refresh_cache,
+    save_cache_entry,
+)
 from utils.url_patterns import race_climbs_path
 
 
-def load_race_cache() -> dict[str, Any]:
-    """Load race data from cache file if it exists and is not expired."""
-    return load_cache(RACE_CACHE_FILE, "race_data")
+def load_race_cache_entry(race_url: str) -> RaceData | None:
+    """Load cached data for a single race if it exists and is not expired."""
+    import_json_cache(LEGACY_RACE_CACHE_FILE, RACE_CACHE_FILE, "race_data")
+    cached_race = load_cache_entry(RACE_CACHE_FILE, race_url)
 
+    # Error results written by older versions are treated as a miss so they get refetched
+    if cached_race is None or is_error_payload(cached_race):
+        return None
+    return cached_race
 
-def save_race_cache(race_data: dict[str, Any]) -> None:
-    """Save race data to cache file with timestamp."""
-    save_cache(RACE_CACHE_FILE, race_data, "race_data")
+
+def save_race_cache_entry(race_url: str, race_data: RaceData) -> None:
+    """Save data for a single race to the cache database, skipping error results."""
+    if is_error_payload(race_data):
+        logging.warning(f"⚠️ Not caching failed race fetch for {race_url}")
+        return
+    save_cache_entry(RACE_CACHE_FILE, race_url, race_data)
 
 
 def refresh_race_cache() -> None:
-    """Force refresh of race cache by deleting the cache file."""
+    """Force refresh of race cache by emptying the cache database (the file is kept)."""
     refresh_cache(RACE_CACHE_FILE, "Race")
 
 
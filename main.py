@@ -85,19 +85,17 @@ def main() -> None:
         progress_bar.progress(progress, text=text)
 
     pipeline_config = PipelineConfig(
-        {
-            "race_key": selected_race_key,
-            "use_cache": True,
-            "force_refresh": False,
-            "fuzzy_threshold": 0.9,
-            "require_team_match": True,
-            "include_debug_info": True,
-            "verbose_logging": True,
-            "use_enhanced_analytics": True,
-            "include_comparisons": True,
-            "calculate_trends": True,
-            "parallel_processing": True,
-        }
+        race_key=selected_race_key,
+        use_cache=True,
+        force_refresh=False,
+        fuzzy_threshold=0.9,
+        require_team_match=True,
+        include_debug_info=True,
+        verbose_logging=True,
+        use_enhanced_analytics=True,
+        include_comparisons=True,
+        calculate_trends=True,
+        parallel_processing=True,
     )
 
     logger.info("Running data pipeline")
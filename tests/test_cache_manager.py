@@ -0,0 +1,185 @@
+"""Tests for the JSON and SQLite cache files."""
+
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from utils import cache_manager
+from utils.cache_manager import (
+    import_json_cache,
+    is_error_payload,
+    load_cache,
+    load_cache_entry,
+    load_entry_cache,
+    load_entry_cache_keys,
+    refresh_cache,
+    save_cache,
+    save_cache_entry,
+)
+
+
+@pytest.fixture
+def json_cache_file(tmp_path):
+    return str(tmp_path / "cache.json")
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def _write_legacy_cache(path, entries, cached_at=None):
+    cache_data = {"cached_at": cached_at or datetime.now().isoformat(), "riders_data": entries}
+    path.write_bytes(orjson.dumps(cache_data))
+
+
+def test_json_cache_round_trip(json_cache_file):
+    save_cache(json_cache_file, {"rider/a": {"rank": 1}}, "riders_data")
+
+    assert load_cache(json_cache_file, "riders_data") == {"rider/a": {"rank": 1}}
+    assert load_cache(json_cache_file + ".missing", "riders_data") == {}
+
+
+def test_json_cache_is_read_once_per_file_version(json_cache_file):
+    save_cache(json_cache_file, {"rider/a": {"rank": 1}}, "riders_data")
+    load_cache(json_cache_file, "riders_data")
+
+    misses = cache_manager._read_json_cache.cache_info().misses
+    load_cache(json_cache_file, "riders_data")
+    assert cache_manager._read_json_cache.cache_info().misses == misses
+
+    save_cache(json_cache_file, {"rider/a": {"rank": 1}, "rider/b": {"rank": 2}}, "riders_data")
+    assert load_cache(json_cache_file, "riders_data") == {
+        "rider/a": {"rank": 1},
+        "rider/b": {"rank": 2},
+    }
+
+
+def test_json_cache_returns_copies(json_cache_file):
+    save_cache(json_cache_file, {"startlist": {"riders": [1, 2]}}, "startlist_data")
+
+    cached = load_cache(json_cache_file, "startlist_data")
+    cached["other"] = {}
+    cached["startlist"]["riders"].append(3)
+
+    assert load_cache(json_cache_file, "startlist_data") == {"startlist": {"riders": [1, 2]}}
+
+
+def test_entry_cache_round_trip(cache_file):
+    save_cache_entry(cache_file, "rider/a", {"name": "A", "points": [1, 2]})
+    save_cache_entry(cache_file, "rider/b", {"name": "B", "points": []})
+
+    assert load_cache_entry(cache_file, "rider/a") == {"name": "A", "points": [1, 2]}
+    assert load_cache_entry(cache_file, "rider/missing") is None
+    assert load_entry_cache(cache_file) == {
+        "rider/a": {"name": "A", "points": [1, 2]},
+        "rider/b": {"name": "B", "points": []},
+    }
+
+
+def test_entry_cache_sees_writes(cache_file):
+    save_cache_entry(cache_file, "rider/a", {"rank": 1})
+    assert load_cache_entry(cache_file, "rider/a") == {"rank": 1}
+
+    save_cache_entry(cache_file, "rider/a", {"rank": 1, "points": 10})
+    assert load_cache_entry(cache_file, "rider/a") == {"rank": 1, "points": 10}
+
+
+def test_loaded_entries_are_copies(cache_file):
+    save_cache_entry(cache_file, "rider/a", {"points": [1, 2]})
+
+    load_cache_entry(cache_file, "rider/a")["points"].append(3)
+    load_entry_cache(cache_file)["rider/a"]["points"].append(4)
+
+    assert load_cache_entry(cache_file, "rider/a") == {"points": [1, 2]}
+
+
+def test_same_size_overwrite_is_visible_immediately(cache_file):
+    save_cache_entry(cache_file, "rider/a", {"rank": 1})
+    assert load_cache_entry(cache_file, "rider/a") == {"rank": 1}
+    assert load_entry_cache_keys(cache_file) == {"rider/a"}
+
+    # Same encoded size, so the file version alone may not change
+    save_cache_entry(cache_file, "rider/a", {"rank": 2})
+    save_cache_entry(cache_file, "rider/b", {"rank": 3})
+    assert load_cache_entry(cache_file, "rider/a") == {"rank": 2}
+    assert load_entry_cache_keys(cache_file) == {"rider/a", "rider/b"}
+
+
+def test_expired_entries_are_ignored(cache_file, json_cache_file, monkeypatch):
+    save_cache(json_cache_file, {"rider/a": {"rank": 1}}, "riders_data")
+    save_cache_entry(cache_file, "rider/a", {"rank": 1})
+    monkeypatch.setattr(cache_manager, "CACHE_EXPIRY_DELTA", timedelta(0))
+
+    assert load_cache(json_cache_file, "riders_data") == {}
+    assert load_cache_entry(cache_file, "rider/a") is None
+    assert load_entry_cache(cache_file) == {}
+
+
+def test_non_string_keys_are_stringified_like_json(json_cache_file, cache_file):
+    save_cache(json_cache_file, {"stage": {1: "p1", 2: "p4"}}, "race_data")
+    save_cache_entry(cache_file, "stage", {1: "p1", 2: "p4"})
+
+    assert load_cache(json_cache_file, "race_data") == {"stage": {"1": "p1", "2": "p4"}}
+    assert load_cache_entry(cache_file, "stage") == {"1": "p1", "2": "p4"}
+
+    with open(json_cache_file) as f:
+        assert json.load(f)["race_data"] == {"stage": {"1": "p1", "2": "p4"}}
+
+
+def test_entries_written_by_stdlib_json_still_load(cache_file):
+    save_cache_entry(cache_file, "rider/a", {"rank": 1})
+    with closing(sqlite3.connect(cache_file)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, cached_at) VALUES (?, ?, ?)",
+            ("rider/b", json.dumps({"name": "Chloé"}), datetime.now().isoformat()),
+        )
+
+    assert load_cache_entry(cache_file, "rider/b") == {"name": "Chloé"}
+
+
+def test_import_json_cache_runs_once_and_skips_errors(tmp_path, cache_file):
+    json_file = tmp_path / "cache.json"
+    _write_legacy_cache(json_file, {"rider/a": {"rank": 1}, "rider/b": {"error": "timeout"}})
+
+    import_json_cache(str(json_file), cache_file, "riders_data")
+    assert load_entry_cache(cache_file) == {"rider/a": {"rank": 1}}
+
+    _write_legacy_cache(json_file, {"rider/c": {"rank": 3}})
+    import_json_cache(str(json_file), cache_file, "riders_data")
+    assert load_entry_cache(cache_file) == {"rider/a": {"rank": 1}}
+
+
+def test_imported_entries_keep_the_legacy_cache_date(tmp_path, cache_file):
+    json_file = tmp_path / "cache.json"
+    _write_legacy_cache(json_file, {"rider/a": {"rank": 1}}, cached_at="2020-01-01T00:00:00")
+
+    import_json_cache(str(json_file), cache_file, "riders_data")
+
+    assert load_entry_cache(cache_file) == {}
+
+
+def test_refresh_empties_sqlite_cache_but_keeps_file(tmp_path, cache_file):
+    json_file = tmp_path / "cache.json"
+    _write_legacy_cache(json_file, {"rider/a": {"rank": 1}})
+    import_json_cache(str(json_file), cache_file, "riders_data")
+
+    assert load_entry_cache(cache_file) == {"rider/a": {"rank": 1}}
+
+    refresh_cache(cache_file, "PCS")
+    import_json_cache(str(json_file), cache_file, "riders_data")
+
+    assert (tmp_path / "cache.db").exists()
+    assert load_entry_cache(cache_file) == {}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [({"error": "timeout"}, True), ({"rank": 1}, False), ([{"error": "x"}], False), (None, False)],
+)
+def test_is_error_payload(value, expected):
+    assert is_error_payload(value) is expected
@@ -0,0 +1,104 @@
+"""Tests for the combined rider analytics processor."""
+
+import pytest
+
+from data.processors.combined_rider_analytics import (
+    _format_time_gap,
+    calculate_race_specific_analytics,
+)
+
+
+def _row(rank, rider_name, time, **extra):
+    return {"rank": rank, "rider_name": rider_name, "team_name": "Team", "time": time, **extra}
+
+
+@pytest.fixture
+def race_data():
+    stage_1 = {
+        "stage_url": "race/test/2025/stage-1",
+        "date": "2025-07-26",
+        "profile_icon": "p1",
+        "distance": 120.0,
+        "results": [
+            _row(1, "KOPECKY Lotte", "3:00:00", pcs_points=100, uci_points=50),
+            _row(2, "WIEBES Lorena", "3:00:00", pcs_points=60, uci_points=25),
+        ],
+        "general_classification": [
+            _row(1, "KOPECKY Lotte", "3:00:00"),
+            _row(2, "WIEBES Lorena", "3:00:04"),
+        ],
+        "points_classification": [_row(1, "KOPECKY Lotte", None, pcs_points=10)],
+    }
+    stage_2 = {
+        "stage_url": "race/test/2025/stage-2",
+        "date": "2025-07-27",
+        "profile_icon": "p4",
+        "distance": 140.0,
+        "results": [
+            _row(1, "WIEBES Lorena", "4:00:00", pcs_points=100, uci_points=50),
+            _row(2, "KOPECKY Lotte", "4:01:30", pcs_points=60, uci_points=25),
+        ],
+        "general_classification": [
+            _row(1, "WIEBES Lorena", "7:00:04"),
+            _row(2, "KOPECKY Lotte", "7:01:30"),
+        ],
+    }
+    future_stage = {"stage_url": "race/test/2025/stage-3", "date": "2025-07-28"}
+    return {"stages": [stage_1, stage_2, future_stage]}
+
+
+def test_race_specific_analytics_for_matched_rider(race_data):
+    rider = {
+        "fantasy_name": "L. KOPECKY",
+        "full_name": "Lotte Kopecky",
+        "stars": 20,
+        "pcs_data": {"name": "Lotte Kopecky"},
+    }
+
+    analytics = calculate_race_specific_analytics(rider, race_data, "TEST")
+
+    assert analytics["rider_name"] == "KOPECKY Lotte"
+    assert analytics["has_stage_data"] is True
+    assert analytics["completed_stages"] == 2
+    assert analytics["total_stages"] == 3
+
+    assert [perf["stage_rank"] for perf in analytics["stage_results"]] == [1, 2]
+    assert analytics["stage_wins"] == 1
+    assert analytics["top_5_stage_finishes"] == 2
+    assert analytics["avg_stage_position"] == 1.5
+    assert analytics["total_stage_pcs_points"] == 160
+    assert analytics["points_per_star"] == 8.0
+
+    second_stage = analytics["stage_results"][1]
+    assert second_stage["time_gap_to_winner_seconds"] == 90
+    assert second_stage["time_behind_winner"] == "1:30"
+    assert second_stage["time_behind_leader"] == "1:26"
+
+    gc = analytics["gc_analytics"]
+    assert gc["rank_changes"] == [1, 2]
+    assert gc["current_rank"] == 2
+    assert gc["best_rank"] == 1
+    assert gc["stages_in_top_5"] == 2
+    assert analytics["points_analytics"]["points_earned"] == 10
+    assert analytics["kom_analytics"] is None
+    assert analytics["best_classification"] == "gc"
+
+
+def test_race_specific_analytics_for_unknown_rider(race_data):
+    rider = {"fantasy_name": "X. NOBODY", "full_name": "Xavier Nobody", "stars": 5}
+
+    analytics = calculate_race_specific_analytics(rider, race_data, "TEST")
+
+    assert analytics["has_stage_data"] is False
+    assert analytics["stage_results"] == []
+    assert analytics["avg_stage_position"] is None
+    assert analytics["gc_analytics"] is None
+    assert analytics["best_classification"] is None
+
+
+@pytest.mark.parametrize(
+    ("gap_seconds", "expected"),
+    [(59, "0:59"), (90, "1:30"), (-30, "-0:30"), (-90, "-1:30"), (0, None), (None, None)],
+)
+def test_format_time_gap(gap_seconds, expected):
+    assert _format_time_gap(gap_seconds) == expected
@@ -0,0 +1,128 @@
+"""Tests for rider name normalization and cross-source matching."""
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from data import matching
+from data.matching import (
+    NameIndex,
+    StageResultsIndex,
+    calculate_name_similarity,
+    find_best_match,
+    match_all_data_sources,
+    normalize_rider_name,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RACE_URL = "race/tour-de-france-femmes/2025"
+
+
+def _load_json(file_name):
+    return orjson.loads((REPO_ROOT / file_name).read_bytes())
+
+
+@pytest.fixture(scope="module")
+def raw_data():
+    startlist = _load_json("tdf_femmes_2025_startlist.json")["startlist_data"]
+    return {
+        "fantasy_riders": _load_json("fantasy-data.json"),
+        "startlist_riders": startlist[f"{RACE_URL}/startlist"]["startlist"],
+        "pcs_cache": _load_json("pcs_data_cache.json")["riders_data"],
+        "race_data": _load_json("race_data_cache.json")["race_data"][RACE_URL],
+    }
+
+
+@pytest.mark.parametrize(
+    ("raw_name", "expected"),
+    [
+        ("KOPECKY Lotte", "kopecky lotte"),
+        ("(Le Court) Pienaar Kimberley", "pienaar kimberley"),
+        ("Kopecky, Lotte", "lotte kopecky"),
+        ("Smith Jr", "smith"),
+        ("  A \t  B\n", "a b"),
+        ("L. KOPECKY", "l. kopecky"),
+        ("DYGERT Chloé", "dygert chloe"),
+        ("FERRAND-PRÉVOT Pauline", "ferrand-prevot pauline"),
+        ("OTTESTAD Mie Bjørndal", "ottestad mie bjørndal"),
+        ("BRAUßE Franziska", "brauße franziska"),
+        ("", ""),
+    ],
+)
+def test_normalize_rider_name(raw_name, expected):
+    assert normalize_rider_name(raw_name) == expected
+
+
+def test_accented_and_plain_spellings_match_exactly():
+    assert calculate_name_similarity("FORTIN Émilie", "Fortin Emilie") == 1.0
+    assert find_best_match("FORTIN Emilie", ["FORTIN Emma", "FORTIN Émilie"]) == (
+        "FORTIN Émilie",
+        1.0,
+    )
+
+
+def test_name_index_exact_and_blocked_lookups():
+    index = NameIndex(
+        ["KOPECKY Lotte", "Le Court-Pienaar Kimberley", "WIEBES Lorena", "Kopecky Anna"]
+    )
+
+    assert index.exact["kopecky lotte"] == 0
+    assert index.blocked_candidates("lotte kopecky") == ([0, 3], ["kopecky lotte", "kopecky anna"])
+    assert index.blocked_candidates("pienaar") == ([], [])
+
+
+def test_find_best_match_falls_back_to_full_scan():
+    candidates = ["KOPECKY Lotte", "Le Court-Pienaar Kimberley", "WIEBES Lorena"]
+
+    # No candidate token starts with "pie", so only the full scan finds this one
+    assert find_best_match("Pienaar", candidates, threshold=0.8) == (
+        "Le Court-Pienaar Kimberley",
+        0.9,
+    )
+    assert find_best_match("Nobody Here", candidates, threshold=0.8) == (None, 0.0)
+
+
+@pytest.mark.parametrize("fuzzy_threshold", [0.8, 0.95])
+def test_match_all_data_sources_on_repo_data(raw_data, fuzzy_threshold):
+    matches = match_all_data_sources(raw_data, fuzzy_threshold)
+
+    assert len(matches) == len(raw_data["fantasy_riders"])
+    assert all(match["has_race_data"] for match in matches.values())
+
+    assert matches["F. GERRITSE"]["canonical_name"] == "Gerritse Femke"
+    assert matches["A. AVOINE"]["canonical_name"] == "Avoine Alison"
+    assert matches["C. DYGERT"]["canonical_name"] == "Dygert Chloé"
+
+    fuzzy_matches = {
+        name: (match["race_match"].stage_name, match["race_match"].match_confidence)
+        for name, match in matches.items()
+        if match["race_match"].match_method != "exact"
+    }
+    assert fuzzy_matches == {
+        "K. LE COURT PIENAAR": ("(Le Court) Pienaar Kimberley", 0.95),
+        "M. VALLIERES MILL": ("Vallieres Magdeleine", 0.95),
+    }
+    for name in fuzzy_matches:
+        assert matches[name]["race_match"].match_method == "high_confidence_fuzzy"
+
+
+def test_race_score_batches_are_shared_across_indexes():
+    race_data = {
+        "stages": [
+            {"results": [{"rider_name": "KOPECKY Lotte"}, {"rider_name": "WIEBES Lorena"}]},
+            {"results": [{"rider_name": "WIEBES Lorena"}, {"rider_name": "VOLLERING Demi"}]},
+        ]
+    }
+    names = ["kopecky lote", "vollering demy"]
+
+    first = StageResultsIndex(race_data).score_names(names, 80)
+    hits = matching._score_name_batch.cache_info().hits
+    second = StageResultsIndex(race_data).score_names(names, 80)
+
+    assert matching._score_name_batch.cache_info().hits == hits + 1
+    for name in names:
+        assert not second[name].flags.writeable
+        assert second[name].tolist() == first[name].tolist()
+    assert first["kopecky lote"].argmax() == 0
+    assert first["vollering demy"].argmax() == 2
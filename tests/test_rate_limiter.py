@@ -0,0 +1,52 @@
+"""Tests for the outbound request rate limiter."""
+
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that sleeping advances, recording each sleep."""
+    state = {"now": 100.0, "sleeps": []}
+
+    def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleep)
+    return state
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_rejects_non_positive_rate(rate):
+    with pytest.raises(ValueError):
+        RateLimiter(rate)
+
+
+def test_burst_starts_immediately_then_spaces_requests(clock):
+    limiter = RateLimiter(rate=2.0, burst=3)
+
+    for _ in range(3):
+        limiter.acquire()
+    assert clock["sleeps"] == []
+
+    limiter.acquire()
+    limiter.acquire()
+    assert clock["sleeps"] == pytest.approx([0.5, 0.5])
+
+
+def test_idle_time_is_credited_back_up_to_burst(clock):
+    limiter = RateLimiter(rate=1.0, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock["now"] += 60.0
+    limiter.acquire()
+    limiter.acquire()
+    assert clock["sleeps"] == []
+
+    limiter.acquire()
+    assert clock["sleeps"] == pytest.approx([1.0])
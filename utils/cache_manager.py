@@ -2,23 +2,35 @@
 Cache management utilities for the Fantasy Cycling Stats app.
 """
 
-import json
 import logging
 import os
+import sqlite3
+from contextlib import closing
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from config.settings import CACHE_EXPIRY_DELTA
 
+# JSON cache files stay indented for readability; non-string keys are stringified like json.dump
+_JSON_CACHE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 def load_cache(cache_file: str, data_key: str = "data") -> dict[str, Any]:
     """Load data from cache file if it exists and is not expired."""
-    if not os.path.exists(cache_file):
+    file_version = _get_file_version(cache_file)
+    if file_version is None:
+        return {}
+
+    cache_bytes = _read_json_cache(cache_file, file_version)
+    if cache_bytes is None:
         return {}
 
     try:
-        with open(cache_file) as f:
-            cache_data = json.load(f)
+        # Decoding per call hands each caller its own objects, never the memoized file
+        cache_data = orjson.loads(cache_bytes)
 
         # Check if cache is expired
         cache_date = datetime.fromisoformat(cache_data.get("cached_at", "1970-01-01"))
@@ -27,7 +39,7 @@ def load_cache(cache_file: str, data_key: str = "data") -> dict[str, Any]:
             return {}
 
         return cache_data.get(data_key, {})
-    except (json.JSONDecodeError, ValueError) as e:
+    except (TypeError, ValueError) as e:
         logging.error(f"❌ Error reading cache file: {e}")
         return {}
 
@@ -37,17 +49,206 @@ def save_cache(cache_file: str, data: Any, data_key: str = "data") -> None:
     cache_data = {"cached_at": datetime.now().isoformat(), data_key: data}
 
     try:
-        with open(cache_file, "w") as f:
-            json.dump(cache_data, f, indent=2)
+        with open(cache_file, "wb") as f:
+            f.write(orjson.dumps(cache_data, option=_JSON_CACHE_OPTIONS))
         logging.info(f"✅ Data cached to {cache_file}")
     except Exception as e:
         logging.error(f"❌ Error saving cache: {e}")
 
 
+def load_entry_cache(cache_file: str) -> dict[str, Any]:
+    """Load all unexpired entries from a SQLite key-value cache file."""
+    file_version = _get_file_version(cache_file)
+    if file_version is None:
+        return {}
+
+    cutoff = (datetime.now() - CACHE_EXPIRY_DELTA).isoformat()
+    entries = _read_entry_cache(cache_file, file_version)
+
+    # Decoding per call hands each caller its own objects, never the memoized rows
+    try:
+        return {
+            key: orjson.loads(value)
+            for key, (cached_at, value) in entries.items()
+            if cached_at >= cutoff
+        }
+    except orjson.JSONDecodeError as e:
+        logging.error(f"❌ Error reading cache file: {e}")
+        return {}
+
+
+def load_entry_cache_keys(cache_file: str) -> set[str]:
+    """Load the keys of all unexpired entries in a SQLite key-value cache file."""
+    file_version = _get_file_version(cache_file)
+    if file_version is None:
+        return set()
+
+    cutoff = (datetime.now() - CACHE_EXPIRY_DELTA).isoformat()
+    entry_dates = _read_entry_cache_dates(cache_file, file_version)
+
+    return {key for key, cached_at in entry_dates.items() if cached_at >= cutoff}
+
+
+def load_cache_entry(cache_file: str, key: str) -> Any | None:
+    """
+    Load a single unexpired entry from a SQLite key-value cache file.
+
+    The value is decoded on each call, so callers may mutate it freely.
+    """
+    file_version = _get_file_version(cache_file)
+    if file_version is None:
+        return None
+
+    cutoff = (datetime.now() - CACHE_EXPIRY_DELTA).isoformat()
+    entry = _read_entry_cache(cache_file, file_version).get(key)
+
+    if entry is None or entry[0] < cutoff:
+        return None
+
+    try:
+        return orjson.loads(entry[1])
+    except orjson.JSONDecodeError as e:
+        logging.error(f"❌ Error reading cache entry {key}: {e}")
+        return None
+
+
+def save_cache_entry(cache_file: str, key: str, value: Any) -> None:
+    """Insert or replace a single entry in a SQLite key-value cache file."""
+    try:
+        encoded_value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        with closing(_connect_entry_cache(cache_file)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, cached_at) VALUES (?, ?, ?)",
+                (key, encoded_value, datetime.now().isoformat()),
+            )
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        logging.error(f"❌ Error saving cache entry {key}: {e}")
+    finally:
+        _invalidate_entry_caches()
+
+
+def import_json_cache(json_file: str, cache_file: str, data_key: str = "data") -> None:
+    """
+    Import a legacy single-blob JSON cache into a SQLite key-value cache file, once.
+
+    Runs only while the SQLite file does not exist yet; the import creates it, so later
+    calls are a single stat. Entries keep the JSON file's cached_at, so stale data still
+    expires on schedule, and error payloads are skipped so they are fetched again.
+
+    Args:
+        json_file: Path of the legacy JSON cache
+        cache_file: Path of the SQLite key-value cache file
+        data_key: Key of the entries dict inside the JSON cache
+    """
+    if os.path.exists(cache_file) or not os.path.exists(json_file):
+        return
+
+    try:
+        with open(json_file, "rb") as f:
+            cache_data = orjson.loads(f.read())
+
+        cached_at = cache_data.get("cached_at", "1970-01-01")
+        rows = [
+            (key, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS), cached_at)
+            for key, value in cache_data.get(data_key, {}).items()
+            if not is_error_payload(value)
+        ]
+
+        with closing(_connect_entry_cache(cache_file)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, cached_at) VALUES (?, ?, ?)", rows
+            )
+        logging.info(f"📦 Imported {len(rows)} entries from {json_file} into {cache_file}")
+    except (OSError, AttributeError, TypeError, orjson.JSONDecodeError, sqlite3.Error) as e:
+        logging.error(f"❌ Error importing legacy cache {json_file}: {e}")
+    finally:
+        _invalidate_entry_caches()
+
+
+def is_error_payload(value: Any) -> bool:
+    """Whether a fetched value is an error placeholder that must not be cached."""
+    return isinstance(value, dict) and "error" in value
+
+
+def _get_file_version(cache_file: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) identifying the current contents of a file, or None if missing."""
+    try:
+        stat = os.stat(cache_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Cache file reads are memoized per file version, so Streamlit reruns don't re-read
+# unchanged caches, while any write (or deletion) is picked up on the next load
+@lru_cache(maxsize=16)
+def _read_json_cache(cache_file: str, file_version: tuple[int, int]) -> bytes | None:
+    """Read the raw bytes of a JSON cache file."""
+    try:
+        with open(cache_file, "rb") as f:
+            return f.read()
+    except OSError as e:
+        logging.error(f"❌ Error reading cache file: {e}")
+        return None
+
+
+@lru_cache(maxsize=16)
+def _read_entry_cache(
+    cache_file: str, file_version: tuple[int, int]
+) -> dict[str, tuple[str, bytes]]:
+    """Read every entry of a SQLite key-value cache file as key -> (cached_at, encoded value)."""
+    try:
+        with closing(_connect_entry_cache(cache_file)) as conn:
+            rows = conn.execute("SELECT key, cached_at, value FROM cache").fetchall()
+        return {key: (cached_at, value) for key, cached_at, value in rows}
+    except sqlite3.Error as e:
+        logging.error(f"❌ Error reading cache file: {e}")
+        return {}
+
+
+# Membership checks only need keys and dates, so values are never decoded here
+@lru_cache(maxsize=16)
+def _read_entry_cache_dates(cache_file: str, file_version: tuple[int, int]) -> dict[str, str]:
+    """Read every key of a SQLite key-value cache file as key -> cached_at."""
+    try:
+        with closing(_connect_entry_cache(cache_file)) as conn:
+            return dict(conn.execute("SELECT key, cached_at FROM cache").fetchall())
+    except sqlite3.Error as e:
+        logging.error(f"❌ Error reading cache file: {e}")
+        return {}
+
+
+def _invalidate_entry_caches() -> None:
+    """
+    Drop memoized SQLite cache reads after this process writes to a cache file.
+
+    The (mtime_ns, size) file version can miss a same-size page write landing within
+    one mtime tick, so in-process writes never rely on it.
+    """
+    _read_entry_cache.cache_clear()
+    _read_entry_cache_dates.cache_clear()
+
+
+def _connect_entry_cache(cache_file: str) -> sqlite3.Connection:
+    """Open a SQLite key-value cache file, creating its table if needed."""
+    conn = sqlite3.connect(cache_file)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache "
+        "(key TEXT PRIMARY KEY, value TEXT NOT NULL, cached_at TEXT NOT NULL)"
+    )
+    return conn
+
+
 def refresh_cache(cache_file: str, cache_type: str = "") -> None:
-    """Force refresh of cache by deleting the cache file."""
+    """Force refresh of cache by deleting the cache file (or emptying a SQLite cache)."""
     if os.path.exists(cache_file):
-        os.remove(cache_file)
+        if cache_file.endswith(".db"):
+            # Keep the file so a leftover legacy JSON cache is not imported again
+            with closing(_connect_entry_cache(cache_file)) as conn, conn:
+                conn.execute("DELETE FROM cache")
+            _invalidate_entry_caches()
+        else:
+            os.remove(cache_file)
         logging.info(
             f"🗑️ {cache_type} cache cleared. Data will be refreshed on next fetch."
         )
@@ -60,9 +261,12 @@ def get_cache_info(cache_file: str) -> dict[str, Any] | None:
     if not os.path.exists(cache_file):
         return None
 
+    if cache_file.endswith(".db"):
+        return _get_entry_cache_info(cache_file)
+
     try:
-        with open(cache_file) as f:
-            cache_info = json.load(f)
+        with open(cache_file, "rb") as f:
+            cache_info = orjson.loads(f.read())
 
         cache_date = datetime.fromisoformat(cache_info.get("cached_at", "1970-01-01"))
 
@@ -78,3 +282,21 @@ def get_cache_info(cache_file: str) -> dict[str, Any] | None:
         }
     except Exception:
         return None
+
+
+def _get_entry_cache_info(cache_file: str) -> dict[str, Any] | None:
+    """Get cache information for a SQLite key-value cache file."""
+    try:
+        with closing(_connect_entry_cache(cache_file)) as conn:
+            data_count, last_updated = conn.execute(
+                "SELECT COUNT(*), MAX(cached_at) FROM cache"
+            ).fetchone()
+
+        cache_date = datetime.fromisoformat(last_updated or "1970-01-01")
+
+        return {
+            "last_updated": cache_date.strftime("%Y-%m-%d %H:%M:%S"),
+            "data_count": data_count,
+        }
+    except Exception:
+        return None
@@ -0,0 +1,47 @@
+"""
+Rate limiting utilities for outbound API requests.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often requests may start.
+
+    Up to ``burst`` requests may start immediately; after that, requests are
+    spaced so the long-run rate never exceeds ``rate`` per second. Unlike a fixed
+    sleep after every request, idle time is credited back as burst capacity.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Maximum number of requests allowed to start back-to-back
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may start."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            # Reserve a token; a negative balance is this caller's place in the queue
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)